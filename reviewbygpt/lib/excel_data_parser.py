@@ -2,17 +2,57 @@ import os
 import logging
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 import shutil
 
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Styles shared by every cell that needs them, openpyxl styles are immutable
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_TITLE_FONT = Font(bold=True)
+_SCORE_ALIGNMENT = Alignment(horizontal="right")
+
 class ExcelDataParser:
-    def __init__(self, excel_file_path):
+    ENGINES = ("openpyxl", "xlsxwriter")
+
+    def __init__(self, excel_file_path, engine="openpyxl"):
         """
         Initialize the Excel data parser with proper path handling
+
+        engine selects how sheets are written: "openpyxl" edits the workbook in
+        place, "xlsxwriter" streams a fresh file on every write, which is faster
+        for append-only workloads. Each xlsxwriter write reads and rewrites the
+        whole workbook, so its rows should be added inside batch() rather than
+        one at a time
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown Excel engine '{engine}', expected one of {self.ENGINES}")
+        if engine == "xlsxwriter" and xlsxwriter is None:
+            logger.warning("xlsxwriter is not installed, falling back to openpyxl")
+            engine = "openpyxl"
+        self.engine = engine
+        
+        # Rows buffered while a batch is open, keyed by sheet name
+        self._pending_rows = {}
+        self._batch_depth = 0
+        
+        # Next empty row and header row of each sheet in the currently open workbook
+        self._next_row = {}
+        self._headers = {}
+        
+        # Last workbook loaded or saved, reused while the file on disk is unchanged
+        self._wb = None
+        self._wb_stat = None
+
         # Store the base directory
         self.excel_dir = excel_file_path
         
@@ -22,7 +62,7 @@ class ExcelDataParser:
         # Create the full path to the Excel file
         self.full_excel_path = os.path.join(self.excel_dir, self.excel_filename)
         
-        logger.info(f"Excel parser initialized with file: {self.full_excel_path}")
+        logger.info(f"Excel parser initialized with file: {self.full_excel_path} (engine: {self.engine})")
 
     def create_excel_file(self):
         """
@@ -34,21 +74,20 @@ class ExcelDataParser:
                 os.makedirs(self.excel_dir)
                 logger.info(f"Created directory: {self.excel_dir}")
 
-            # Create a fresh workbook
-            wb = Workbook()
+            # Create a fresh workbook in write-only mode, rows are streamed straight to disk
+            wb = Workbook(write_only=True)
+            
+            # Write-only workbooks start without a default sheet, so add the info sheet explicitly
+            sheet = wb.create_sheet("Info")
+            # Add some metadata to this sheet
+            sheet.append(["Created on:", f"{__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+            sheet.append(["File path:", f"{self.full_excel_path}"])
             
-            # Keep the default sheet but rename it to avoid deletion errors
-            if "Sheet" in wb.sheetnames:
-                sheet = wb["Sheet"]
-                sheet.title = "Info"
-                # Add some metadata to this sheet
-                sheet['A1'] = "Created on:"
-                sheet['B1'] = f"{__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                sheet['A2'] = "File path:"
-                sheet['B2'] = f"{self.full_excel_path}"
+            # Keep the results of the previous run before the fresh workbook replaces them
+            self._backup_excel_file()
             
             # Save the workbook
-            wb.save(self.full_excel_path)
+            self._replace_with(wb)
             logger.info(f"Created new Excel file: {self.full_excel_path}")
             return True
         except Exception as e:
@@ -62,24 +101,97 @@ class ExcelDataParser:
         if os.path.exists(self.full_excel_path):
             backup_path = f"{self.full_excel_path}.bak"
             try:
-                shutil.copy2(self.full_excel_path, backup_path)
+                # Links cannot overwrite, so drop the previous backup first
+                if os.path.lexists(backup_path):
+                    os.remove(backup_path)
+                try:
+                    # A hard link is instant whatever the file size, and stays intact
+                    # because saves replace the file instead of rewriting it
+                    os.link(self.full_excel_path, backup_path)
+                except OSError:
+                    # Cross-device or no link support, fall back to a full copy
+                    shutil.copy2(self.full_excel_path, backup_path)
                 logger.info(f"Created backup of Excel file at: {backup_path}")
                 return True
             except Exception as e:
                 logger.warning(f"Failed to create backup: {e}")
         return False
 
+    def _file_stat(self):
+        """
+        Return the modification time and size of the Excel file, or None if it is missing
+        """
+        try:
+            stat = os.stat(self.full_excel_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cache_workbook(self, wb):
+        """
+        Remember a workbook that matches the file currently on disk
+        """
+        if wb is not self._wb:
+            # Row positions and headers are only valid for the workbook they were read from
+            self._next_row = {}
+            self._headers = {}
+        self._wb = wb
+        self._wb_stat = self._file_stat()
+        return wb
+
+    def _replace_with(self, wb):
+        """
+        Save the workbook to a temporary file and swap it in place, so the old
+        file (and any hard link to it) is never truncated
+        """
+        temp_path = f"{self.full_excel_path}.tmp"
+        try:
+            wb.save(temp_path)
+            os.replace(temp_path, self.full_excel_path)
+        except Exception:
+            # Do not leave a half-written temporary file next to the workbook
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _save_workbook(self, wb):
+        """
+        Save the workbook and keep it cached, since it now matches the file
+        """
+        try:
+            self._replace_with(wb)
+        except Exception:
+            # The workbook holds changes that never reached the disk
+            self.reload()
+            raise
+        return self._cache_workbook(wb)
+
+    def reload(self):
+        """
+        Drop the cached workbook so the next access reads the file again
+        """
+        self._wb = None
+        self._wb_stat = None
+        self._next_row = {}
+        self._headers = {}
+
     def _ensure_valid_workbook(self):
         """
         Ensure we have a valid workbook, creating a new one if necessary
         """
+        # Reuse the cached workbook unless the file was changed by someone else
+        if self._wb is not None and self._wb_stat == self._file_stat():
+            return self._wb
+        
         try:
             # Try to load the workbook to test if it's valid
             if os.path.exists(self.full_excel_path):
                 try:
                     wb = load_workbook(self.full_excel_path)
                     # If we get here, the workbook is valid
-                    return wb
+                    return self._cache_workbook(wb)
                 except Exception as e:
                     logger.error(f"Excel file appears to be corrupted: {e}")
                     # Backup the corrupted file first
@@ -97,25 +209,75 @@ class ExcelDataParser:
             
             # Create a new workbook
             self.create_excel_file()
-            return load_workbook(self.full_excel_path)
+            return self._cache_workbook(load_workbook(self.full_excel_path))
             
         except Exception as e:
             logger.error(f"Failed to ensure valid workbook: {e}")
             # Last resort - create a completely new file
             try:
                 wb = Workbook()
-                wb.save(self.full_excel_path)
-                return wb
+                return self._save_workbook(wb)
             except:
                 raise RuntimeError("Cannot create or load Excel workbook")
 
+    def _open_for_read(self):
+        """
+        Open the workbook in read-only mode for operations that never modify it
+        """
+        try:
+            return load_workbook(self.full_excel_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.warning(f"Could not open Excel file in read-only mode: {e}")
+            # Let the regular loader recover missing or corrupted files, then retry
+            self._ensure_valid_workbook()
+            return load_workbook(self.full_excel_path, read_only=True, data_only=True)
+
+    def _open_for_append(self):
+        """
+        Open the workbook for operations that add sheets, headers or rows
+        """
+        # Appending to an existing file needs the editable mode, write-only
+        # workbooks can only be created from scratch
+        return self._ensure_valid_workbook()
+
+    def _next_row_for(self, ws):
+        """
+        Return the next empty row of a sheet, reading its dimensions only once
+        per opened workbook
+        """
+        if ws.title not in self._next_row:
+            # max_row walks every stored cell, so it is only read the first time
+            self._next_row[ws.title] = ws.max_row + 1
+        return self._next_row[ws.title]
+
+    def _headers_for(self, ws):
+        """
+        Return the headers of a sheet, reading its first row only once
+        per opened workbook
+        """
+        if ws.title not in self._headers:
+            self._headers[ws.title] = [cell.value for cell in ws[1] if cell.value]
+        return self._headers[ws.title]
+
     def apply_excel_template(self, sheet_name, identifiers):
         """
         Apply initial template to Excel sheet with better error handling
         """
         try:
+            # Check if this is a QA sheet by examining identifiers
+            is_qa_sheet = any(identifier.startswith("QE") for identifier in identifiers)
+            
+            # For QA sheet, make sure 'Title' is included in the identifiers
+            if is_qa_sheet and "TITLE" not in identifiers:
+                # Unpack instead of concatenating so tuples of identifiers work too
+                identifiers = ["TITLE", *identifiers]
+                logger.info("Added 'Title' field to QA sheet identifiers")
+            
+            if self.engine == "xlsxwriter":
+                return self._apply_template_xlsxwriter(sheet_name, identifiers)
+            
             # Get a valid workbook
-            wb = self._ensure_valid_workbook()
+            wb = self._open_for_append()
             
             # Check if the sheet exists, if not create it
             if sheet_name not in wb.sheetnames:
@@ -124,36 +286,24 @@ class ExcelDataParser:
             else:
                 ws = wb[sheet_name]
             
-            # Check if this is a QA sheet by examining identifiers
-            is_qa_sheet = any(identifier.startswith("QE") for identifier in identifiers)
-            
-            # For QA sheet, make sure 'Title' is included in the identifiers
-            if is_qa_sheet and "TITLE" not in identifiers:
-                identifiers = ["TITLE"] + identifiers
-                logger.info("Added 'Title' field to QA sheet identifiers")
-            
             # Apply the headers if the sheet is empty or force update
             if ws.max_row <= 1:  # Sheet is empty or has only headers
-                # Set header style
-                header_font = Font(bold=True)
-                header_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-                
                 for col_idx, identifier in enumerate(identifiers, start=1):
+                    # Set header style
                     cell = ws.cell(row=1, column=col_idx, value=identifier)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-                
-                # Auto-adjust column widths based on identifier length
-                for col_idx, identifier in enumerate(identifiers, start=1):
-                    col_letter = ws.cell(row=1, column=col_idx).column_letter
+                    cell.font = _HEADER_FONT
+                    cell.fill = _HEADER_FILL
+                    cell.alignment = _HEADER_ALIGNMENT
+                    
+                    # Auto-adjust column width based on identifier length
                     width = max(15, len(str(identifier)) + 5)  # Minimum width of 15
-                    ws.column_dimensions[col_letter].width = width
+                    ws.column_dimensions[get_column_letter(col_idx)].width = width
+                self._headers.pop(sheet_name, None)
                 
                 logger.info(f"Applied template to sheet '{sheet_name}' with {len(identifiers)} identifiers")
             
             # Save the workbook
-            wb.save(self.full_excel_path)
+            self._save_workbook(wb)
             return True
             
         except Exception as e:
@@ -170,77 +320,134 @@ class ExcelDataParser:
     def fill_excel_with_data(self, sheet_name, data):
         """
         Fill Excel sheet with data with better error handling
+        
+        Inside a batch the row is only buffered and written on flush()
+        """
+        if self._batch_depth:
+            self._pending_rows.setdefault(sheet_name, []).append(data)
+            return True
+        
+        return self._write_rows({sheet_name: [data]})
+    
+    def fill_excel_with_rows(self, sheet_name, rows):
+        """
+        Fill Excel sheet with several rows of data, saving the workbook only once
+        
+        Inside a batch the rows are only buffered and written on flush()
+        """
+        rows = list(rows)
+        if not rows:
+            return True
+        
+        if self._batch_depth:
+            self._pending_rows.setdefault(sheet_name, []).extend(rows)
+            return True
+        
+        return self._write_rows({sheet_name: rows})
+    
+    def batch(self):
+        """
+        Buffer rows instead of saving the workbook on every call:
+        
+            with parser.batch():
+                parser.fill_excel_with_data(...)
+        
+        Buffered rows are written with a single save when the batch exits
+        """
+        return self
+    
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+        return False
+    
+    def flush(self):
+        """
+        Write every buffered row, opening and saving the workbook only once
+        """
+        if not self._pending_rows:
+            return True
+        
+        pending, self._pending_rows = self._pending_rows, {}
+        return self._write_rows(pending)
+    
+    def _write_rows(self, pending):
+        """
+        Append rows to their sheets and save the workbook a single time
         """
         try:
-            # Try to load the existing workbook
-            wb = self._ensure_valid_workbook()
+            if self.engine == "xlsxwriter":
+                return self._fill_xlsxwriter(pending)
             
-            # Check if the sheet exists, create it if not
-            if sheet_name not in wb.sheetnames:
-                logger.warning(f"Sheet '{sheet_name}' not found, creating it")
-                ws = wb.create_sheet(sheet_name)
-                # We need to initialize the headers too
-                if sheet_name == "qa_sheet":
-                    # Create headers for QA sheet
-                    # In apply_excel_template method, change:
-                    qa_headers = ["Title"] + [f"QE{i}" for i in range(1, 9)] + [f"QE{i}_SCORE" for i in range(1, 9)] + ["TOTAL_SCORE"]
-                    self.apply_excel_template(sheet_name, qa_headers)
-                    # Reload the workbook
-                    wb = load_workbook(self.full_excel_path)
-                    ws = wb[sheet_name]
-                elif sheet_name == "de_sheet":
-                    # Use all keys from the data for DE sheet
-                    de_headers = list(data.keys())
-                    self.apply_excel_template(sheet_name, de_headers)
-                    # Reload the workbook
-                    wb = load_workbook(self.full_excel_path)
-                    ws = wb[sheet_name]
-                else:
-                    logger.error(f"Unable to create headers for unknown sheet type: {sheet_name}")
-                    return False
-            else:
-                ws = wb[sheet_name]
-            
-            # Get the headers from the first row
-            headers = []
-            for cell in ws[1]:
-                if cell.value:
-                    headers.append(cell.value)
+            # Try to load the existing workbook
+            wb = self._open_for_append()
             
-            if not headers:
-                logger.error(f"No headers found in sheet '{sheet_name}'")
-                return False
+            # Rows of sheets that cannot be written make the whole call report failure
+            failed = False
             
-            # Find the next empty row
-            next_row = ws.max_row + 1
+            # Create any missing sheets first, they are saved on their own
+            missing_sheets = [sheet_name for sheet_name in pending if sheet_name not in wb.sheetnames]
+            if missing_sheets:
+                for sheet_name in missing_sheets:
+                    if not self._create_missing_sheet(sheet_name, pending[sheet_name][0]):
+                        failed = True
+                # The new sheets were saved through the cached workbook
+                wb = self._ensure_valid_workbook()
             
-            # Fill in the data
-            for col_idx, header in enumerate(headers, start=1):
-                # Check if the header exists in the data
-                value = data.get(header, "")
+            added_rows = {}
+            for sheet_name, rows in pending.items():
+                if sheet_name not in wb.sheetnames:
+                    continue
+                ws = wb[sheet_name]
                 
-                # Set the cell value
-                cell = ws.cell(row=next_row, column=col_idx, value=value)
+                # Get the headers from the first row, fixed once the template is applied
+                headers = self._headers_for(ws)
                 
-                # Apply formatting based on content
-                if header == "Title":
+                if not headers:
+                    logger.error(f"No headers found in sheet '{sheet_name}'")
+                    failed = True
+                    continue
+                
+                # Only these columns get formatting, the rest are plain values
+                title_cols = [col_idx for col_idx, header in enumerate(headers, start=1) if header == "Title"]
+                score_cols = [col_idx for col_idx, header in enumerate(headers, start=1) if header != "Title" and "SCORE" in header]
+                
+                for data in rows:
+                    # Find the next empty row
+                    next_row = self._next_row_for(ws)
+                    self._next_row[sheet_name] = next_row + 1
+                    
+                    # Fill in the whole row at once, missing headers are left empty
+                    ws.append([data.get(header, "") for header in headers])
+                    
                     # Make title bold
-                    cell.font = Font(bold=True)
-                elif "SCORE" in header:
+                    for col_idx in title_cols:
+                        ws.cell(row=next_row, column=col_idx).font = _TITLE_FONT
+                    
                     # Right-align score values
-                    cell.alignment = Alignment(horizontal="right")
-                    # Format as number with 1 decimal place if it's a number
-                    try:
-                        if isinstance(value, (int, float)):
+                    for col_idx in score_cols:
+                        cell = ws.cell(row=next_row, column=col_idx)
+                        cell.alignment = _SCORE_ALIGNMENT
+                        # Format as number with 1 decimal place if it's a number
+                        if isinstance(cell.value, (int, float)):
                             cell.number_format = "0.0"
-                    except:
-                        pass
+                
+                added_rows[sheet_name] = (len(rows), next_row)
+            
+            if not added_rows:
+                return False
             
             # Save the workbook with error handling
             try:
-                wb.save(self.full_excel_path)
-                logger.info(f"Data added to sheet '{sheet_name}' at row {next_row}")
-                return True
+                self._save_workbook(wb)
+                for sheet_name, (row_count, last_row) in added_rows.items():
+                    logger.info(f"Data added to sheet '{sheet_name}' ({row_count} rows, last at row {last_row})")
+                return not failed
             except Exception as save_err:
                 logger.error(f"Error saving workbook: {save_err}")
                 # Try creating a new file with a different name as a last resort
@@ -254,44 +461,188 @@ class ExcelDataParser:
                     return False
                 
         except Exception as e:
-            logger.error(f"Error filling Excel with data for sheet '{sheet_name}': {e}")
+            logger.error(f"Error filling Excel with data for sheets {list(pending)}: {e}")
+            # Rows may have been added to the cached workbook without being saved
+            self.reload()
             return False
     
+    def _create_missing_sheet(self, sheet_name, data):
+        """
+        Create a sheet that was not templated beforehand, deriving its headers
+        from the sheet type
+        """
+        logger.warning(f"Sheet '{sheet_name}' not found, creating it")
+        # We need to initialize the headers too
+        if sheet_name == "qa_sheet":
+            # Create headers for QA sheet
+            qa_headers = ["Title"] + [f"QE{i}" for i in range(1, 9)] + [f"QE{i}_SCORE" for i in range(1, 9)] + ["TOTAL_SCORE"]
+            return self.apply_excel_template(sheet_name, qa_headers)
+        elif sheet_name == "de_sheet":
+            # Use all keys from the data for DE sheet
+            de_headers = list(data.keys())
+            return self.apply_excel_template(sheet_name, de_headers)
+        
+        logger.error(f"Unable to create headers for unknown sheet type: {sheet_name}")
+        return False
+
+    def _read_sheets(self):
+        """
+        Read every sheet as plain row values, keeping the sheet order
+        """
+        wb = self._open_for_read()
+        try:
+            return {ws.title: [list(row) for row in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+        finally:
+            wb.close()
+
+    def _write_sheets(self, sheets):
+        """
+        Write all sheets to a fresh file with xlsxwriter and swap it in place
+        """
+        temp_path = f"{self.full_excel_path}.tmp"
+        try:
+            self._write_sheets_to(temp_path, sheets)
+            os.replace(temp_path, self.full_excel_path)
+        except Exception:
+            # Do not leave a half-written temporary file next to the workbook
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_sheets_to(self, path, sheets):
+        """
+        Write all sheets with xlsxwriter to the file at path
+        """
+        wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+        try:
+            # Formats are created once and shared by every cell that needs them
+            header_format = wb.add_format({"bold": True, "bg_color": "#E0E0E0", "align": "center", "valign": "vcenter"})
+            title_format = wb.add_format({"bold": True})
+            score_format = wb.add_format({"align": "right", "num_format": "0.0"})
+            score_text_format = wb.add_format({"align": "right"})
+            
+            for sheet_name, rows in sheets.items():
+                ws = wb.add_worksheet(sheet_name)
+                
+                # The info sheet holds plain metadata, no template applied
+                if sheet_name == "Info" or not rows:
+                    for row_idx, row in enumerate(rows):
+                        ws.write_row(row_idx, 0, row)
+                    continue
+                
+                headers = rows[0]
+                for col_idx, header in enumerate(headers):
+                    if header is not None:
+                        ws.set_column(col_idx, col_idx, max(15, len(str(header)) + 5))
+                ws.write_row(0, 0, headers, header_format)
+                
+                title_cols = [col_idx for col_idx, header in enumerate(headers) if header == "Title"]
+                score_cols = [col_idx for col_idx, header in enumerate(headers) if header and "SCORE" in str(header)]
+                
+                for row_idx, row in enumerate(rows[1:], start=1):
+                    ws.write_row(row_idx, 0, row)
+                    # Only the styled columns are rewritten with their format
+                    for col_idx in title_cols:
+                        if col_idx < len(row):
+                            ws.write(row_idx, col_idx, row[col_idx], title_format)
+                    for col_idx in score_cols:
+                        if col_idx < len(row):
+                            value = row[col_idx]
+                            ws.write(row_idx, col_idx, value, score_format if isinstance(value, (int, float)) else score_text_format)
+        finally:
+            wb.close()
+
+    def _apply_template_xlsxwriter(self, sheet_name, identifiers):
+        """
+        Apply the template by rewriting the workbook with xlsxwriter
+        """
+        sheets = self._read_sheets()
+        rows = sheets.setdefault(sheet_name, [])
+        
+        # Apply the headers if the sheet is empty or has only headers
+        if len(rows) <= 1:
+            sheets[sheet_name] = [list(identifiers)]
+            logger.info(f"Applied template to sheet '{sheet_name}' with {len(identifiers)} identifiers")
+        
+        self._write_sheets(sheets)
+        return True
+
+    def _fill_xlsxwriter(self, pending):
+        """
+        Append rows of data by rewriting the workbook once with xlsxwriter
+        """
+        sheets = self._read_sheets()
+        failed = False
+        
+        missing_sheets = [sheet_name for sheet_name in pending if sheet_name not in sheets]
+        if missing_sheets:
+            for sheet_name in missing_sheets:
+                if not self._create_missing_sheet(sheet_name, pending[sheet_name][0]):
+                    failed = True
+            sheets = self._read_sheets()
+        
+        added_rows = {}
+        for sheet_name, data_rows in pending.items():
+            if sheet_name not in sheets:
+                continue
+            rows = sheets[sheet_name]
+            headers = [header for header in rows[0] if header] if rows else []
+            
+            if not headers:
+                logger.error(f"No headers found in sheet '{sheet_name}'")
+                failed = True
+                continue
+            
+            rows.extend([data.get(header, "") for header in headers] for data in data_rows)
+            added_rows[sheet_name] = (len(data_rows), len(rows))
+        
+        if not added_rows:
+            return False
+        
+        self._write_sheets(sheets)
+        for sheet_name, (row_count, last_row) in added_rows.items():
+            logger.info(f"Data added to sheet '{sheet_name}' ({row_count} rows, last at row {last_row})")
+        return not failed
+
     def get_existing_data(self, sheet_name):
         """
         Retrieve existing data from a sheet with better error handling
         """
         try:
-            # Ensure we have a valid workbook
-            wb = self._ensure_valid_workbook()
-            
+            return list(self.iter_existing_data(sheet_name))
+        except Exception as e:
+            logger.error(f"Error retrieving data from sheet '{sheet_name}': {e}")
+            return []
+
+    def iter_existing_data(self, sheet_name):
+        """
+        Yield the rows of a sheet one at a time as dicts keyed by header,
+        streaming from a read-only workbook instead of building the whole list
+        """
+        # Nothing is modified here, so a read-only workbook is enough
+        wb = self._open_for_read()
+        
+        try:
             # Check if the sheet exists
             if sheet_name not in wb.sheetnames:
                 logger.warning(f"Sheet '{sheet_name}' does not exist in the workbook")
-                return []
+                return
                 
             ws = wb[sheet_name]
             
             # Get the headers from the first row
-            headers = []
-            for cell in ws[1]:
-                if cell.value:
-                    headers.append(cell.value)
+            header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = [value for value in header_row if value]
             
             if not headers:
                 logger.warning(f"No headers found in sheet '{sheet_name}'")
-                return []
+                return
             
-            # Extract the data from each row
-            data = []
-            for row in range(2, ws.max_row + 1):
-                row_data = {}
-                for col, header in enumerate(headers, start=1):
-                    cell_value = ws.cell(row=row, column=col).value
-                    row_data[header] = cell_value
-                data.append(row_data)
-                
-            return data
-        except Exception as e:
-            logger.error(f"Error retrieving data from sheet '{sheet_name}': {e}")
-            return []
+            # Extract the data from each row, reading plain values avoids building a Cell per entry
+            for row in ws.iter_rows(min_row=2, max_col=len(headers), values_only=True):
+                yield dict(zip(headers, row))
+        finally:
+            # Read-only workbooks keep the file handle open until closed
+            wb.close()
@@ -1,16 +1,80 @@
 import requests
 import logging
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import os
 import base64
+import functools
+import mmap
 import PyPDF2
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_pdf_text(pdf_path: str, mtime: float, size: int) -> str:
+    """
+    Extract the text of every page, joined by blank lines.
+
+    mtime and size are only part of the cache key, so a PDF that changed on
+    disk is extracted again.
+    """
+    if pdfium is not None:
+        # PDFium does the text extraction in C++
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            parts = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_bounded())
+                textpage.close()
+                page.close()
+            return "".join(part + "\n\n" for part in parts)
+        finally:
+            pdf.close()
+
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return "".join(page.extract_text() + "\n\n" for page in pdf_reader.pages)
+
+
+def _read_pdf_text(pdf_path: str) -> str:
+    """
+    Extract the text of one PDF, or an error placeholder if it cannot be read.
+
+    Module level so extract_text_batch can run it in worker processes.
+    """
+    try:
+        stat = os.stat(pdf_path)
+        return _extract_pdf_text(pdf_path, stat.st_mtime, stat.st_size)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error extracting text from PDF: {str(e)}")
+        return f"[Error extracting PDF content: {str(e)}]"
+
+
 class LLMPromptHandler:
 
+    # Requests kept in flight at once by send_many, also the size of the connection pool
+    MAX_CONCURRENCY = 8
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
+        # Reuse connections across prompts instead of opening one per request
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_CONCURRENCY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """
+        Close the pooled connections to the LLM API.
+        """
+        self._session.close()
+
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
         Extract text content from a PDF file.
@@ -21,25 +85,37 @@ class LLMPromptHandler:
         Returns:
             str: Extracted text from the PDF
         """
-        text = ""
-        try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
-            return text
-        except Exception as e:
-            self.logger.error(f"Error extracting text from PDF: {str(e)}")
-            return f"[Error extracting PDF content: {str(e)}]"
+        return _read_pdf_text(pdf_path)
     
-    def send_to_llm(self, content: str, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def extract_text_batch(self, pdf_paths: List[str]) -> Dict[str, str]:
+        """
+        Extract text content from several PDF files in parallel.
+
+        Extraction is CPU-bound and independent per file, so the files are
+        spread over a process pool instead of being read one after another.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+
+        Returns:
+            Dict[str, str]: Extracted text of each PDF, keyed by its path
+        """
+        if len(pdf_paths) <= 1:
+            return {pdf_path: self.extract_text_from_pdf(pdf_path) for pdf_path in pdf_paths}
+
+        max_workers = min(os.cpu_count() or 1, len(pdf_paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            texts = executor.map(_read_pdf_text, pdf_paths, chunksize=2)
+            return dict(zip(pdf_paths, texts))
+
+    def send_to_llm(self, content: str, file_path: Optional[str] = None, pdf_text: Optional[str] = None) -> Dict[str, Any]:
         """
         Send a prompt to the LLM API and get the response.
 
         Args:
             content: Content for the LLM (the prompt)
             file_path: Optional path of file (PDF or text) to be added to prompt
+            pdf_text: Optional text already extracted from the PDF at file_path
 
         Returns:
             Dict[str, Any]: Parsed response from LLM
@@ -56,20 +132,29 @@ class LLMPromptHandler:
                 self.logger.info(f"Processing file at path: {file_path}")
                 
                 if file_path.lower().endswith('.pdf'):
-                    # Extract text from PDF
-                    pdf_text = self.extract_text_from_pdf(file_path)
+                    # Extract text from PDF, unless the caller already did
+                    if pdf_text is None:
+                        pdf_text = self.extract_text_from_pdf(file_path)
                     messages[1]["content"] += f"\n\nPDF Content:\n{pdf_text}"
                 else:
-                    # For non-PDF files, read as text if possible
+                    # For non-PDF files, map the file so the OS pages it in on demand
+                    # instead of copying it through a read buffer (empty files cannot be mapped)
+                    with open(file_path, 'rb') as f:
+                        size = os.fstat(f.fileno()).st_size
+                        file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            file_content = f.read()
-                        messages[1]["content"] += f"\n\nFile Content:\n{file_content}"
-                    except UnicodeDecodeError:
-                        # If the file is not text-readable, encode it as base64
-                        with open(file_path, 'rb') as f:
-                            file_content = base64.b64encode(f.read()).decode('utf-8')
-                        messages[1]["content"] += f"\n\nFile is binary. Base64 encoded content: {file_content[:100]}..."
+                        # Read as text if possible, with the line endings text mode would give
+                        try:
+                            file_content = str(file_data, 'utf-8').replace("\r\n", "\n").replace("\r", "\n")
+                            messages[1]["content"] += f"\n\nFile Content:\n{file_content}"
+                        except UnicodeDecodeError:
+                            # If the file is not text-readable, encode it as base64. Only the
+                            # first 100 characters are sent, which cover the first 75 bytes
+                            file_content = base64.b64encode(file_data[:75]).decode('utf-8')
+                            messages[1]["content"] += f"\n\nFile is binary. Base64 encoded content: {file_content}..."
+                    finally:
+                        if size:
+                            file_data.close()
                 
             # Prepare the request payload according to the API format
             payload = {
@@ -80,15 +165,10 @@ class LLMPromptHandler:
                 "stream": False
             }
 
-            # Make the API request
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            response = requests.post(
+            # Make the API request, the session serializes the payload and sets the JSON content type
+            response = self._session.post(
                 url="http://127.0.0.1:8000/v1/chat/completions",
-                headers=headers,
-                data=json.dumps(payload)  # Convert payload to JSON string
+                json=payload
             )
             
             # Raise an exception if the response was not successful
@@ -117,4 +197,33 @@ class LLMPromptHandler:
             return {"error": f"Failed to communicate with LLM: {str(e)}"}
         except Exception as e:
             self.logger.error(f"Error processing LLM response: {str(e)}")
-            return {"error": f"Error processing response: {str(e)}"}
\ No newline at end of file
+            return {"error": f"Error processing response: {str(e)}"}
+
+    def send_many(self, jobs: List[Tuple[str, Optional[str]]], max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Send several prompts concurrently and get their responses.
+
+        Each request spends most of its time waiting on the model, so running
+        them side by side overlaps that latency across papers. The PDFs are
+        extracted beforehand in worker processes, PDFium is not thread-safe.
+
+        Args:
+            jobs: (content, file_path) pairs as accepted by send_to_llm, file_path may be None
+            max_concurrency: Maximum number of requests in flight, defaults to MAX_CONCURRENCY and
+                is capped at it, the size of the connection pool
+
+        Returns:
+            List[Dict[str, Any]]: Parsed responses, in the same order as jobs
+        """
+        if not jobs:
+            return []
+
+        # Only the HTTP requests run on threads
+        pdf_paths = list(dict.fromkeys(file_path for _, file_path in jobs
+                                       if file_path and file_path.lower().endswith('.pdf') and os.path.exists(file_path)))
+        pdf_texts = self.extract_text_batch(pdf_paths)
+
+        # More threads than pooled connections would open and discard extra connections
+        max_workers = min(max_concurrency or self.MAX_CONCURRENCY, self.MAX_CONCURRENCY, len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda job: self.send_to_llm(*job, pdf_text=pdf_texts.get(job[1])), jobs))
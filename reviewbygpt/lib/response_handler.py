@@ -1,16 +1,23 @@
 import os
 import sys
 import re
+import functools
 
 class ResponseHandler:
     def __init__(self):
         print("Created response handler object.")
 
+    # Compile the pattern of each identifier only once
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _identifier_pattern(identifier):
+        return re.compile(rf"{re.escape(identifier)}:\s*(.*?)(?=\n\w+:|$)", re.DOTALL)
+
     # Look for part of text and extract what is after
     def extract_by_identifier(self, response, identifier):
 
         # Use a regular expression to find the text after the specific identifier
-        pattern = re.compile(rf"{re.escape(identifier)}:\s*(.*?)(?=\n\w+:|$)", re.DOTALL)
+        pattern = self._identifier_pattern(identifier)
         match = pattern.search(response)
 
         if match:
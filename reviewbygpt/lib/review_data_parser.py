@@ -1,48 +1,173 @@
 import os
+import bisect
 import yaml
 import re
 import logging
 from reviewbygpt.lib.response_handler import ResponseHandler
 
+# Use the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+
+# Section markers are fixed literals, searched with str.find
+_QA_START_MARKER = "==QUALITY_ASSESSMENT_START=="
+_QA_END_MARKER = "==QUALITY_ASSESSMENT_END=="
+_DE_START_MARKER = "==DATA_EXTRACTION_START=="
+_DE_END_MARKER = "==DATA_EXTRACTION_END=="
+
+# Patterns are compiled once at import instead of on every parse
+_SECTION_MARKER_RE = re.compile(r"==(QUALITY_ASSESSMENT|DATA_EXTRACTION)_(START|END)==")
+
+# Quality assessment items: QEn: [text] QEn_SCORE: [score]
+# The description stays lazy and may be empty, \s* already covers line breaks before the score
+_QA_ITEM_RE = re.compile(r"(QE\d+):\s*(.*?)\s*\1_SCORE:\s*([0-9.]+)", re.DOTALL)
+_QE_ID_RE = re.compile(r'(QE\d+):')
+_QE_SCORE_ID_RE = re.compile(r'(QE\d+)_SCORE:')
+_SCORE_TOKEN_RE = re.compile(r'\s*(\S*)')
+_LEGACY_QA_RE = re.compile(r"(QE\d+)[:\.]?\s*(.*?)\s*(?:QE\d+\s*Score|QE\d+Score|QE\d+_SCORE)[:\.]?\s*([0-9.]+)", re.DOTALL)
+
+# Data extraction fields: uppercase keys followed by a colon and value
+# A key is a whole run of uppercase letters and spaces (which covers "X OF Y" keys) ending at
+# the colon, so the runs are possessive and a run not followed by a colon fails without backtracking
+_DE_FIELD_RE = re.compile(r"([A-Z][A-Z\s]++):\s*(.*?)(?=\s++[A-Z][A-Z\s]++:|$)", re.DOTALL)
+_DE_KEY_RE = re.compile(r'([A-Z][A-Z\s]++):')
+_LEGACY_DE_END_RE = re.compile(r"Minimum acceptance score|SECTION 3|Cutoff Score|\n\n\n")
+# Last resort title lookup, only used when no data extraction field was found
+_EMERGENCY_TITLE_RE = re.compile(r'TITLE\s*:(.*?)(?=\s[A-Z]{2,}|$)', re.IGNORECASE | re.DOTALL)
+
+# Deletion tables for the characters stripped from extracted text
+_STRIP_QUOTES = str.maketrans("", "", '"')
+_STRIP_KEY_CHARS = str.maketrans("", "", '"*')
+
+# Analysis prompt, only the question and field lists and the cutoff score come from the config
+_PROMPT_TEMPLATE = (
+    # Start with clear structured instructions
+    "Hello, I need you to analyze the PDF document I've uploaded. Please follow these instructions precisely:\n\n"
+    # Quality Assessment section with clear formatting
+    "===== PART 1: QUALITY ASSESSMENT =====\n"
+    "{qa_lines}"
+    # Data Extraction section with clear formatting
+    "\n===== PART 2: DATA EXTRACTION =====\n"
+    "{de_lines}"
+    # Format instructions with explicit markers and examples
+    "\nMinimum acceptance score: {cutoff_score}\n\n"
+    "===== OUTPUT FORMAT INSTRUCTIONS =====\n"
+    # Very explicit output formatting for quality assessment
+    "For Quality Assessment, follow this exact format with no deviations:\n\n"
+    "==QUALITY_ASSESSMENT_START==\n"
+    "QE1: [Your brief description here]\n"
+    "QE1_SCORE: [score]\n\n"
+    "QE2: [Your brief description here]\n"
+    "QE2_SCORE: [score]\n"
+    "==QUALITY_ASSESSMENT_END==\n\n"
+    # Very explicit output formatting for data extraction
+    "For Data Extraction, follow this exact format with no deviations:\n\n"
+    "==DATA_EXTRACTION_START==\n"
+    "AUTHOR: [author names]\n"
+    "YEAR: [publication year]\n"
+    "TITLE: [paper title]\n"
+    "==DATA_EXTRACTION_END==\n\n"
+    # Additional instructions with emphasis on formatting
+    "IMPORTANT INSTRUCTIONS:\n"
+    "1. Use EXACTLY the section markers shown above (==SECTION_START== and ==SECTION_END==)\n"
+    "2. For quality assessment items, use the exact format 'QE1: [text]' followed by a line break and 'QE1_SCORE: [number]'\n"
+    "3. For data extraction fields, use the exact keys I've listed, in ALL CAPS followed by a colon\n"
+    "4. If information is not available, write 'Not Specified (N/S)'\n"
+    "5. Do not add any additional formatting, bullets, or markdown\n"
+    "6. Each item should be on its own line\n"
+    "7. You should respect the line breaks here and replicate them if they exist\n"
+)
         
 class ReviewDataParser:
     def __init__(self, config):
         self.config = config
         self.response_handler = ResponseHandler()
 
+        # Parsed config and the (mtime, size) of the file it was read from
+        self._yaml_cache = None
+        self._yaml_stat = None
+
+        # Last analysis prompt and the config stat it was built from
+        self._prompt_cache = None
+        self._prompt_stat = None
+
+        # Field lists keyed by config section, and the config stat they were built from
+        self._fields_cache = {}
+        self._fields_stat = None
+
     def load_yaml_file(self):
+        """
+        Load the review config, reparsing it only when the file changed on disk
+        """
         try:
-            with open(self.config, 'r') as stream:
-                return yaml.safe_load(stream)
+            # Nanosecond mtime plus size catches rewrites within the same second
+            st = os.stat(self.config)
+            yaml_stat = (st.st_mtime_ns, st.st_size)
+            if self._yaml_cache is not None and yaml_stat == self._yaml_stat:
+                return self._yaml_cache
+
+            # The loader decodes bytes itself, no need for a text wrapper
+            with open(self.config, 'rb') as stream:
+                self._yaml_cache = yaml.load(stream, Loader=SafeLoader)
+                self._yaml_stat = yaml_stat
+                return self._yaml_cache
         except yaml.YAMLError as exc:
             logger.error(f"Error loading YAML file: {exc}")
             return None
 
     def save_yaml_file(self, data):
         try:
-            with open(self.config, 'w') as stream:
-                yaml.dump(data, stream)
-                return True
+            # Serialize in memory first, the file is then written in one go
+            # and is not truncated if dumping fails
+            content = yaml.dump(data, Dumper=SafeDumper, encoding='utf-8')
+            with open(self.config, 'wb') as stream:
+                stream.write(content)
+            # Force the next load to read what was just written
+            self._yaml_cache = None
+            self._yaml_stat = None
+            return True
         except yaml.YAMLError as exc:
             logger.error(f"Error saving YAML file: {exc}")
             return False
 
+    def _cached_fields(self, section):
+        """
+        Returns the field list built for a config section, or None if the config
+        changed since it was built
+        """
+        if self._fields_stat != self._yaml_stat:
+            self._fields_cache = {}
+            self._fields_stat = self._yaml_stat
+        return self._fields_cache.get(section)
+
     def get_all_quality_assessment_fields(self):
         data = self.load_yaml_file()
         if not data or "quality_assessment_questions" not in data:
             logger.error("Invalid or missing quality assessment questions.")
             return []
-        return [{"id": q["id"], "question": q["question"], "scores": q["scores"]} for q in data["quality_assessment_questions"]]
+        # The list is shared between calls while the config is unchanged
+        fields = self._cached_fields("quality_assessment_questions")
+        if fields is None:
+            fields = [{"id": q["id"], "question": q["question"], "scores": q["scores"]} for q in data["quality_assessment_questions"]]
+            self._fields_cache["quality_assessment_questions"] = fields
+        return fields
 
     def get_all_data_extraction_fields(self):
         data = self.load_yaml_file()
         if not data or "data_extraction_fields" not in data:
             logger.error("Invalid or missing data extraction fields.")
             return []
-        return [{"key": field["key"], "description": field["description"]} for field in data["data_extraction_fields"]]
+        fields = self._cached_fields("data_extraction_fields")
+        if fields is None:
+            fields = [{"key": field["key"], "description": field["description"]} for field in data["data_extraction_fields"]]
+            self._fields_cache["data_extraction_fields"] = fields
+        return fields
     
     def get_all_excluding_questions(self):
         data = self.load_yaml_file()
@@ -60,6 +185,11 @@ class ReviewDataParser:
         Create an analysis prompt with explicit formatting instructions
         that produce responses specifically designed for easy extraction
         """
+        # The prompt only depends on the config, reuse it while the file is unchanged
+        self.load_yaml_file()
+        if self._prompt_cache is not None and self._prompt_stat == self._yaml_stat:
+            return self._prompt_cache
+
         qa_fields = self.get_all_quality_assessment_fields()
         de_fields = self.get_all_data_extraction_fields()
         cutoff_score = self.get_cutoff_score()
@@ -68,121 +198,161 @@ class ReviewDataParser:
             logger.error("Missing required fields for analysis prompt.")
             return ""
 
-        # Start with clear structured instructions
-        prompt = "Hello, I need you to analyze the PDF document I've uploaded. Please follow these instructions precisely:\n\n"
-        
-        # Quality Assessment section with clear formatting 
-        prompt += "===== PART 1: QUALITY ASSESSMENT =====\n"
-        for qa in qa_fields:
-            prompt += f"* {qa['id']}: {qa['question']} (Possible scores: {', '.join(map(str, qa['scores']))})\n"
-
-        # Data Extraction section with clear formatting
-        prompt += "\n===== PART 2: DATA EXTRACTION =====\n"
-        for de in de_fields:
-            prompt += f"* {de['key']}: {de['description']}\n"
-
-        # Format instructions with explicit markers and examples
-        prompt += f"\nMinimum acceptance score: {cutoff_score}\n\n"
-        prompt += "===== OUTPUT FORMAT INSTRUCTIONS =====\n"
-        
-        # Very explicit output formatting for quality assessment
-        prompt += "For Quality Assessment, follow this exact format with no deviations:\n\n"
-        prompt += "==QUALITY_ASSESSMENT_START==\n"
-        prompt += "QE1: [Your brief description here]\n"
-        prompt += "QE1_SCORE: [score]\n\n"
-        prompt += "QE2: [Your brief description here]\n"
-        prompt += "QE2_SCORE: [score]\n"
-        prompt += "==QUALITY_ASSESSMENT_END==\n\n"
-        
-        # Very explicit output formatting for data extraction
-        prompt += "For Data Extraction, follow this exact format with no deviations:\n\n"
-        prompt += "==DATA_EXTRACTION_START==\n"
-        prompt += "AUTHOR: [author names]\n"
-        prompt += "YEAR: [publication year]\n"
-        prompt += "TITLE: [paper title]\n"
-        prompt += "==DATA_EXTRACTION_END==\n\n"
-        
-        # Additional instructions with emphasis on formatting
-        prompt += "IMPORTANT INSTRUCTIONS:\n"
-        prompt += "1. Use EXACTLY the section markers shown above (==SECTION_START== and ==SECTION_END==)\n"
-        prompt += "2. For quality assessment items, use the exact format 'QE1: [text]' followed by a line break and 'QE1_SCORE: [number]'\n"
-        prompt += "3. For data extraction fields, use the exact keys I've listed, in ALL CAPS followed by a colon\n"
-        prompt += "4. If information is not available, write 'Not Specified (N/S)'\n"
-        prompt += "5. Do not add any additional formatting, bullets, or markdown\n"
-        prompt += "6. Each item should be on its own line\n"
-        prompt += "7. You should respect the line breaks here and replicate them if they exist\n"
-        
-        return prompt
+        qa_lines = "".join(f"* {qa['id']}: {qa['question']} (Possible scores: {', '.join(map(str, qa['scores']))})\n" for qa in qa_fields)
+        de_lines = "".join(f"* {de['key']}: {de['description']}\n" for de in de_fields)
+
+        self._prompt_cache = _PROMPT_TEMPLATE.format(qa_lines=qa_lines, de_lines=de_lines, cutoff_score=cutoff_score)
+        self._prompt_stat = self._yaml_stat
+        return self._prompt_cache
 
     def preprocess_qa_data(self, qa_data, total_score):
         flattened_data = {}
 
         for qa_key, qa_info in qa_data.items():
+            score_key = qa_key + "_SCORE"
             # Check if qa_info is a dictionary
             if isinstance(qa_info, dict):
                 # Add description and score to flattened dictionary
-                flattened_data[qa_key] = qa_info.get(qa_key, "")
-                flattened_data[f"{qa_key}_SCORE"] = qa_info.get("SCORE", "")
+                get = qa_info.get
+                flattened_data[qa_key] = get(qa_key, "")
+                flattened_data[score_key] = get("SCORE", "")
             else:
                 # Handle unexpected cases (e.g., if qa_info is a float or string)
                 flattened_data[qa_key] = str(qa_info)
-                flattened_data[f"{qa_key}_SCORE"] = ""
+                flattened_data[score_key] = ""
 
         # Add total score
         flattened_data["TOTAL_SCORE"] = total_score
 
         return flattened_data
 
+    def parse_response(self, response):
+        """
+        Extracts both the quality assessment and the data extraction data,
+        locating the markers of the two sections in a single scan of the response
+        """
+        sections = self._find_sections(response)
+        
+        qa_content = sections.get("QUALITY_ASSESSMENT")
+        if qa_content is None:
+            logger.warning("Could not find quality assessment section with markers")
+            qa_data = self._legacy_get_quality_assessment_text(response)
+        else:
+            qa_data = self._parse_qa_section(qa_content)
+        
+        de_content = sections.get("DATA_EXTRACTION")
+        if de_content is None:
+            logger.warning("Could not find data extraction section with markers")
+            de_data = self._legacy_get_data_extraction_text(response)
+        else:
+            de_data = self._parse_de_section(de_content)
+        
+        return qa_data, de_data
+
+    def _find_sections(self, response):
+        """
+        Returns the raw content of each marked section, keyed by section name
+        """
+        starts = {}
+        sections = {}
+        
+        for marker in _SECTION_MARKER_RE.finditer(response):
+            name, kind = marker.groups()
+            if name in sections:
+                continue
+            if kind == "START":
+                # Only the first start marker of a section counts
+                starts.setdefault(name, marker.end())
+            elif name in starts:
+                sections[name] = response[starts[name]:marker.start()]
+                if len(sections) == 2:
+                    break
+        
+        return sections
+
+    def _extract_section(self, response, start_marker, end_marker):
+        """
+        Returns the text between the first start marker and the end marker that follows it,
+        or None if either marker is missing
+        """
+        start = response.find(start_marker)
+        if start == -1:
+            return None
+        start += len(start_marker)
+        
+        end = response.find(end_marker, start)
+        if end == -1:
+            return None
+        return response[start:end]
+
     def get_quality_assessment_text(self, response):
         """
         Extracts quality assessment data from a response with explicit section markers
         Enhanced to handle responses without linebreaks between items
         """
-        qa_data = {}
-        total_score = 0
-        
         # Look for the quality assessment section between markers
-        qa_pattern = re.compile(r"==QUALITY_ASSESSMENT_START==(.*?)==QUALITY_ASSESSMENT_END==", re.DOTALL)
-        qa_match = qa_pattern.search(response)
+        qa_content = self._extract_section(response, _QA_START_MARKER, _QA_END_MARKER)
         
-        if not qa_match:
+        if qa_content is None:
             logger.warning("Could not find quality assessment section with markers")
             # Fall back to the original extraction method for backward compatibility
             return self._legacy_get_quality_assessment_text(response)
         
+        return self._parse_qa_section(qa_content)
+
+    def _parse_qa_section(self, qa_content):
+        """
+        Extracts the quality assessment items from the content between the section markers
+        """
+        qa_data = {}
+        total_score = 0
+        
         # Extract the section content
-        qa_content = qa_match.group(1).strip()
-        logger.info(f"Found quality assessment section ({len(qa_content)} chars)")
+        qa_content = qa_content.strip()
+        logger.info("Found quality assessment section (%d chars)", len(qa_content))
         
         # Try different patterns to match QE items and scores
         # Pattern 1: Looks for QEn: [text] QEn_SCORE: [score]
-        item_pattern = re.compile(r"(QE\d+):\s*(.*?)(?:\s*|\n)\1_SCORE:\s*([0-9.]+)", re.DOTALL)
-        matches = item_pattern.findall(qa_content)
+        matches = _QA_ITEM_RE.findall(qa_content)
         
         if not matches:
             # Pattern 2: Alternative approach for more challenging formats
             logger.warning("Using alternative pattern for QA extraction")
             
-            # Try to extract all QE IDs
-            qe_ids = re.findall(r'(QE\d+):', qa_content)
+            # Locate every QE ID and score marker in a single pass each
+            id_matches = list(_QE_ID_RE.finditer(qa_content))
+            qe_ids = [match.group(1) for match in id_matches]
+            
+            # Only the first occurrence of an ID is used as its start
+            first_index = {}
+            for i, qe_id in enumerate(qe_ids):
+                first_index.setdefault(qe_id, i)
+            
+            # Start of the next marker with a different ID, walking back from the end
+            next_other_start = [-1] * len(id_matches)
+            for i in range(len(id_matches) - 2, -1, -1):
+                if qe_ids[i + 1] != qe_ids[i]:
+                    next_other_start[i] = id_matches[i + 1].start()
+                else:
+                    next_other_start[i] = next_other_start[i + 1]
+            
+            score_positions = {}
+            for match in _QE_SCORE_ID_RE.finditer(qa_content):
+                score_positions.setdefault(match.group(1), []).append(match.start())
             
             # For each QE ID, extract the description and score
             for qe_id in qe_ids:
                 # Find where this QE ID starts
-                qe_start = qa_content.find(f"{qe_id}:")
-                if qe_start == -1:
-                    continue
+                first = first_index[qe_id]
+                qe_start = id_matches[first].start()
                     
                 # Find where the description ends (either at next QE or at score)
-                next_qe_start = -1
-                for next_id in qe_ids:
-                    if next_id != qe_id:
-                        pos = qa_content.find(f"{next_id}:", qe_start + len(qe_id) + 1)
-                        if pos != -1 and (next_qe_start == -1 or pos < next_qe_start):
-                            next_qe_start = pos
+                next_qe_start = next_other_start[first]
                 
                 score_marker = f"{qe_id}_SCORE:"
-                score_pos = qa_content.find(score_marker, qe_start)
+                positions = score_positions.get(qe_id, [])
+                score_idx = bisect.bisect_left(positions, qe_start)
+                score_pos = positions[score_idx] if score_idx < len(positions) else -1
                 
                 if score_pos == -1:
                     logger.warning(f"Could not find score for {qe_id}")
@@ -194,21 +364,18 @@ class ReviewDataParser:
                 description = qa_content[desc_start:desc_end].strip()
                 
                 # Extract score
+                # The score is the first whitespace-delimited token after the marker
                 score_start = score_pos + len(score_marker)
-                score_end = qa_content.find(' ', score_start)
-                if score_end == -1:
-                    score_text = qa_content[score_start:].strip()
-                else:
-                    score_text = qa_content[score_start:score_end].strip()
+                score_text = _SCORE_TOKEN_RE.match(qa_content, score_start).group(1)
                     
                 try:
                     score = float(score_text)
                     qa_data[qe_id] = {
-                        f"{qe_id}": description.replace('"', ""),
+                        f"{qe_id}": description.translate(_STRIP_QUOTES),
                         "SCORE": score
                     }
                     total_score += score
-                    logger.info(f"Extracted {qe_id} with score {score}")
+                    logger.info("Extracted %s with score %s", qe_id, score)
                 except (ValueError, TypeError):
                     logger.warning(f"Could not convert score to float for {qe_id}: {score_text}")
         else:
@@ -218,17 +385,17 @@ class ReviewDataParser:
                 try:
                     score = float(score.strip())
                     qa_data[question_id] = {
-                        f"{question_id}": description.strip().replace('"', ""),
+                        f"{question_id}": description.strip().translate(_STRIP_QUOTES),
                         "SCORE": score
                     }
                     total_score += score
-                    logger.info(f"Extracted {question_id} with score {score}")
+                    logger.info("Extracted %s with score %s", question_id, score)
                 except (ValueError, TypeError):
                     logger.warning(f"Could not convert score to float for {question_id}: {score}")
         
         # Add total score
         qa_data["TOTAL_SCORE"] = total_score
-        logger.info(f"Total QA score: {total_score}")
+        logger.info("Total QA score: %s", total_score)
         
         return self.preprocess_qa_data(qa_data, total_score)
 
@@ -239,14 +406,13 @@ class ReviewDataParser:
         qa_data = {}
         total_score = 0
 
-        qa_pattern = re.compile(r"(QE\d+)[:\.]?\s*(.*?)\s*(?:QE\d+\s*Score|QE\d+Score|QE\d+_SCORE)[:\.]?\s*([0-9.]+)", re.DOTALL)
-        matches = qa_pattern.findall(response)
+        matches = _LEGACY_QA_RE.findall(response)
 
         for match in matches:
             question_id, description, score = match
             score = float(score.strip())
             qa_data[question_id] = {
-                f"{question_id}": description.strip().replace('"', ""),
+                f"{question_id}": description.strip().translate(_STRIP_QUOTES),
                 "SCORE": score
             }
             total_score += score
@@ -261,26 +427,30 @@ class ReviewDataParser:
         Extracts data extraction fields from a response with explicit section markers
         Enhanced to handle responses without proper linebreaks
         """
-        de_data = {}
-        
         # Look for the data extraction section between markers
-        de_pattern = re.compile(r"==DATA_EXTRACTION_START==(.*?)==DATA_EXTRACTION_END==", re.DOTALL)
-        de_match = de_pattern.search(response)
+        de_content = self._extract_section(response, _DE_START_MARKER, _DE_END_MARKER)
         
-        if not de_match:
+        if de_content is None:
             logger.warning("Could not find data extraction section with markers")
             # Fall back to the original extraction method for backward compatibility
             return self._legacy_get_data_extraction_text(response)
         
+        return self._parse_de_section(de_content)
+
+    def _parse_de_section(self, de_content):
+        """
+        Extracts the data extraction fields from the content between the section markers
+        """
+        de_data = {}
+        
         # Extract the section content
-        de_content = de_match.group(1).strip()
-        logger.info(f"Found data extraction section ({len(de_content)} chars)")
+        de_content = de_content.strip()
+        logger.info("Found data extraction section (%d chars)", len(de_content))
         
         # First method: Pattern matching for field extraction
         # This looks for uppercase keys followed by a colon and value
         # Modified pattern that allows uppercase letters in values
-        field_pattern = re.compile(r"([A-Z][A-Z\s]+(?:\sOF\s[A-Z]+)?)\s*:\s*(.*?)(?=\s+[A-Z][A-Z\s]+(?:\sOF\s[A-Z]+)?:|$)", re.DOTALL)        
-        matches = field_pattern.findall(de_content)
+        matches = _DE_FIELD_RE.findall(de_content)
         
         if matches:
             # Process the matches using the pattern
@@ -288,74 +458,42 @@ class ReviewDataParser:
                 key = key.strip()
                 value = value.strip()
                 
-                logger.info(f"Extracted field with pattern: '{key}' = '{value}'")
+                logger.info("Extracted field with pattern: '%s' = '%s'", key, value)
                 de_data[key] = value
         else:
             # Second method: Manual extraction by finding all uppercase fields
             logger.warning("Using manual extraction for data fields")
             
-            # Get all potential field keys (uppercase followed by colon)
-            potential_keys = re.findall(r'([A-Z][A-Z\s]+(?:\sOF\s[A-Z]+)?)\s*:', de_content)
+            # Get all potential field keys (uppercase followed by colon) in one pass
+            key_matches = list(_DE_KEY_RE.finditer(de_content))
             
-            if potential_keys:
+            if key_matches:
                 # For each key, extract the text until the next key
-                for i, key in enumerate(potential_keys):
-                    # Find where this key appears in the content
-                    key_pos = de_content.find(f"{key}:")
-                    if key_pos == -1:
-                        continue
-                    
-                    # Determine where the value ends (at next key or end of content)
-                    value_start = key_pos + len(key) + 1  # +1 for the colon
-                    value_end = len(de_content)
-                    
-                    # Find position of next key if there is one
-                    if i < len(potential_keys) - 1:
-                        next_key = potential_keys[i+1]
-                        next_key_pos = de_content.find(f"{next_key}:", value_start)
-                        if next_key_pos != -1:
-                            value_end = next_key_pos
-                    
-                    # Extract the value
-                    value = de_content[value_start:value_end].strip()
+                for key_match, next_match in zip(key_matches, key_matches[1:] + [None]):
+                    # The value ends at the next key or at the end of the content
+                    value_end = next_match.start() if next_match else len(de_content)
+                    value = de_content[key_match.end():value_end].strip()
                     
                     # Store the result
-                    key = key.strip()
-                    logger.info(f"Manually extracted field: '{key}' = '{value}'")
+                    key = key_match.group(1).strip()
+                    logger.info("Manually extracted field: '%s' = '%s'", key, value)
                     de_data[key] = value
             else:
-                # Third method: Split by obvious separators
+                # The field keys are exactly the uppercase words before a colon, so
+                # splitting on colons cannot find anything the patterns missed
                 logger.warning("No data extraction fields found with pattern or manual extraction.")
-                
-                # Try a very simple split by colon approach for last resort
-                parts = de_content.split(':')
-                if len(parts) > 1:
-                    for i in range(len(parts) - 1):  # Exclude the last part which wouldn't have a value
-                        # The key is the end of the previous part, or the beginning if it's the first
-                        key_part = parts[i].strip()
-                        # Look for uppercase words at the end which might be a key
-                        key_match = re.search(r'([A-Z][A-Z\s]+)$', key_part)
-                        if key_match:
-                            key = key_match.group(1).strip()
-                            # The value is the beginning of the next part before any uppercase words
-                            value_part = parts[i+1]
-                            value_match = re.search(r'^(.*?)(?=[A-Z][A-Z\s]+:|$)', value_part, re.DOTALL)
-                            if value_match:
-                                value = value_match.group(1).strip()
-                                logger.info(f"Basic split extracted: '{key}' = '{value}'")
-                                de_data[key] = value
         
         # If there's content but no keys were extracted, try one more approach
         if de_content and not de_data:
             logger.warning("Attempting final emergency extraction method")
             # This is a last resort: look for any text that might be a title
-            title_match = re.search(r'TITLE\s*:(.*?)(?=\s[A-Z]{2,}|$)', de_content, re.IGNORECASE | re.DOTALL)
+            title_match = _EMERGENCY_TITLE_RE.search(de_content)
             if title_match:
                 title = title_match.group(1).strip()
                 de_data["TITLE"] = title
-                logger.info(f"Emergency extraction found title: {title}")
+                logger.info("Emergency extraction found title: %s", title)
         
-        logger.info(f"Total data extraction fields: {len(de_data)}")
+        logger.info("Total data extraction fields: %d", len(de_data))
         return de_data
 
     def _legacy_get_data_extraction_text(self, response):
@@ -365,38 +503,27 @@ class ReviewDataParser:
         de_data = {}
         
         # First find where "Data Extraction" appears in the text
-        extraction_markers = [
-            "Data Extraction",
-            "Data Extraction:",
-            "Data Extraction\n",
-            "Data Extraction:\n"
-        ]
+        marker_idx = response.find("Data Extraction")
         
-        start_idx = -1
-        for marker in extraction_markers:
-            if marker in response:
-                start_idx = response.find(marker) + len(marker)
-                logger.info(f"Found marker '{marker}' at position {start_idx - len(marker)}")
-                break
-        
-        if start_idx == -1:
+        if marker_idx == -1:
             logger.error("Could not find Data Extraction section in response")
             return de_data
         
-        # Find where the data extraction section ends
-        end_markers = [
-            "Minimum acceptance score",
-            "SECTION 3",
-            "Cutoff Score",
-            "\n\n\n"
-        ]
+        # The header may be followed by a colon and/or a line break, skip those too
+        start_idx = marker_idx + len("Data Extraction")
+        if response[start_idx:start_idx + 1] == ":":
+            start_idx += 1
+        if response[start_idx:start_idx + 1] == "\n":
+            start_idx += 1
+        
+        logger.info("Found marker '%s' at position %d", response[marker_idx:start_idx], marker_idx)
         
+        # Find where the data extraction section ends, the earliest end marker wins
         end_idx = len(response)
-        for marker in end_markers:
-            pos = response.find(marker, start_idx)
-            if pos != -1 and pos < end_idx:
-                end_idx = pos
-                logger.info(f"Found end marker '{marker}' at position {pos}")
+        end_match = _LEGACY_DE_END_RE.search(response, start_idx)
+        if end_match:
+            end_idx = end_match.start()
+            logger.info("Found end marker '%s' at position %d", end_match.group(), end_idx)
         
         # Extract the data extraction section
         data_section = response[start_idx:end_idx].strip()
@@ -420,8 +547,8 @@ class ReviewDataParser:
                 value = parts[1].strip() if len(parts) > 1 else ""
                 
                 # Clean up the key and value
-                key = key.replace('"', "").replace("*", "").strip()
-                value = value.replace('"', "").strip()
+                key = key.translate(_STRIP_KEY_CHARS).strip()
+                value = value.translate(_STRIP_QUOTES).strip()
                 
                 if key:
                     de_data[key] = value
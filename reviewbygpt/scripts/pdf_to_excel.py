@@ -3,13 +3,39 @@ import time
 import pandas as pd
 import logging
 import shutil
+import errno
 import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ReadTimeoutError
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
 import PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+# Pillow is only needed to encode the pages rendered for multimodal models
+try:
+    import PIL
+except ImportError:
+    PIL = None
 import base64
+import io
+import hashlib
+import mmap
 import subprocess
+import functools
+import threading
+import contextlib
+from itertools import chain, islice
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from reviewbygpt.lib.excel_data_parser import ExcelDataParser
 from reviewbygpt.lib.response_handler import ResponseHandler
@@ -21,38 +47,250 @@ from webgpthandler.scripts.chatgpt_interaction_manager import ChatGPTInteraction
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# orjson encodes the large prompts and decodes the streamed chunks several times faster than json
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _json_loads = json.loads
+
+
+# PDFium is not thread-safe, every call into it from one process goes through this lock
+_pdfium_lock = threading.Lock()
+
+
+# Keys the data extraction may use for the paper title, in order of preference
+_TITLE_KEYS = ("TITLE", "Title", "title")
+
+
+_ProbeResult = namedtuple("_ProbeResult", ["returncode", "stdout", "error"])
+
+
+@functools.lru_cache(maxsize=None)
+def _probe(*command):
+    """Run a system probe command once per process, every manager shares its result"""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+        return _ProbeResult(result.returncode, result.stdout, None)
+    except Exception as e:
+        return _ProbeResult(None, "", e)
+
+
+def _read_cache(cache_dir, name):
+    """Return the content cached under name in cache_dir, or None on a miss"""
+    try:
+        with open(os.path.join(cache_dir, name), 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Error reading cache entry '{name}': {e}")
+        return None
+
+
+def _write_cache(cache_dir, name, content):
+    """Store content under name in cache_dir, through a temporary file so a partial entry is never read"""
+    cache_path = os.path.join(cache_dir, name)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Error writing cache entry '{name}': {e}")
+
+
+def extract_pdf_text(pdf_path, cache_dir=None, force_refresh=False):
+    """
+    Extract text content from a PDF file, reusing the text cached in cache_dir for identical files.
+
+    Module level so the extraction can run in worker processes.
+    """
+    if cache_dir is None:
+        return _extract_pdf_text(pdf_path)
+
+    try:
+        # Hash a memory map of the file, the kernel pages it in without copying it through read buffers
+        # (empty files cannot be mapped)
+        with open(pdf_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+            else:
+                digest = hashlib.blake2b(b"", digest_size=16).hexdigest()
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF '{pdf_path}': {e}")
+        return None
+
+    cache_name = f"{digest}.txt"
+    text = None if force_refresh else _read_cache(cache_dir, cache_name)
+    if text is not None:
+        logger.info("Using cached text of PDF: %s (%d chars)", pdf_path, len(text))
+        return text
+
+    text = _extract_pdf_text(pdf_path)
+    if text:
+        _write_cache(cache_dir, cache_name, text)
+    return text
+
+
+def _extract_pdf_text(pdf_path):
+    """Extract text content from a PDF file"""
+    try:
+        # Collect the pages and join them once, appending to a string copies it every page
+        text_parts = []
+        if pdfium is not None:
+            # PDFium does the text extraction in C++, much faster than PyPDF2, and maps the file itself
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    num_pages = len(pdf)
+                    logger.info("Extracting text from PDF: %s (%d pages)", pdf_path, num_pages)
+
+                    for page_num in range(num_pages):
+                        page = pdf[page_num]
+                        textpage = page.get_textpage()
+                        text_parts.append(textpage.get_text_bounded())
+                        textpage.close()
+                        page.close()
+
+                        # Log progress for large PDFs
+                        if num_pages > 10 and page_num % 5 == 0:
+                            logger.debug("Extracted %d/%d pages...", page_num + 1, num_pages)
+                finally:
+                    pdf.close()
+        else:
+            # PyPDF2 reads the document through a memory map of the file
+            with open(pdf_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                pdf_reader = PyPDF2.PdfReader(mapped)
+                num_pages = len(pdf_reader.pages)
+                logger.info("Extracting text from PDF: %s (%d pages)", pdf_path, num_pages)
+
+                for page_num in range(num_pages):
+                    page = pdf_reader.pages[page_num]
+                    text_parts.append(page.extract_text())
+
+                    # Log progress for large PDFs
+                    if num_pages > 10 and page_num % 5 == 0:
+                        logger.debug("Extracted %d/%d pages...", page_num + 1, num_pages)
+        text = "".join(text_parts)
+
+        # Log info about extracted content
+        text_length = len(text)
+        logger.info("Successfully extracted %d characters from PDF", text_length)
+
+        # Log a sample of the content to verify extraction, the slice is only built when it is shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample of extracted text: %s...", text[:200])
+
+        return text
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF '{pdf_path}': {e}")
+        return None
+
+
+def render_pdf_pages(pdf_path, scale=2):
+    """
+    Render every page of a PDF to a base64 encoded PNG for vision-capable models.
+
+    Module level so the rendering can run in worker processes.
+    """
+    try:
+        images = []
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                logger.info("Rendering PDF pages: %s (%d pages)", pdf_path, len(pdf))
+                for page in pdf:
+                    bitmap = page.render(scale=scale)
+                    buffer = io.BytesIO()
+                    bitmap.to_pil().save(buffer, format="PNG")
+                    images.append(base64.b64encode(buffer.getvalue()).decode('ascii'))
+                    bitmap.close()
+                    page.close()
+            finally:
+                pdf.close()
+        return images
+    except Exception as e:
+        logger.error(f"Error rendering pages of PDF '{pdf_path}': {e}")
+        return None
+
+
 class OllamaInteractionManager:
     """Class to manage interactions with Ollama API"""
     
-    def __init__(self, base_url="http://localhost:11434", model="gemma2:latest", use_gpu=True, max_content_length=None):
+    # Seconds to wait for the next streamed chunk before giving up on a request. The first chunk
+    # only arrives once the whole prompt is processed, so this also bounds that wait
+    STREAM_IDLE_TIMEOUT = 600
+    
+    # How long Ollama keeps the model in memory after a request, long enough to span the gaps between papers
+    KEEP_ALIVE = "30m"
+    
+    def __init__(self, base_url="http://localhost:11434", model="gemma2:latest", use_gpu=True, max_content_length=None,
+                 cache_dir=None, force_refresh=False, multimodal=False, unload_on_close=False):
         self.base_url = base_url
         self.model = model
         self.use_gpu = use_gpu
         self.max_content_length = max_content_length  # Set to None for no truncation
         self.api_endpoint = f"{self.base_url}/api/generate"
+        self._model_loaded = False
+        # Unloading on close frees the memory, but also for other clients of the same server using the model
+        self.unload_on_close = unload_on_close
+        # Whether the chat API works on this server, None until the first request tells
+        self._use_chat_api = None
+        # Extracted texts and responses are cached by content hash, None disables the cache.
+        # With force_refresh the cache is only written, never read
+        self.cache_dir = cache_dir
+        self.force_refresh = force_refresh
+        # Vision-capable models (llava, llama3.2-vision, ...) can read rendered pages instead of extracted text
+        self.multimodal = multimodal
+        if multimodal and (pdfium is None or PIL is None):
+            missing = " and ".join(name for name, module in (("pypdfium2", pdfium), ("Pillow", PIL)) if module is None)
+            logger.error(f"Multimodal mode needs {missing} to render PDF pages, install it or text extraction is used instead")
+            self.multimodal = False
+
+        # Keep connections to the API alive between requests instead of reconnecting each time,
+        # transient gateway errors are retried (urllib3 does not retry the POST requests)
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Responses still being streamed, close drops them instead of waiting for the model
+        self._open_streams = set()
+        self._streams_lock = threading.Lock()
+        self._closed = False
         logger.info(f"Initialized Ollama interaction manager with model: {model} (GPU: {'enabled' if use_gpu else 'disabled'})")
         logger.info(f"PDF content truncation: {'disabled' if max_content_length is None else f'limited to {max_content_length} chars'}")
         
+        # The system checks below only report to the log, skip them when nothing would be shown
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        
         # Check if CUDA is available when GPU is requested
         if use_gpu:
             self._check_cuda_availability()
             
         # Check installed Ollama version
-        try:
-            import subprocess
-            result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                logger.info(f"Ollama version: {result.stdout.strip()}")
-            else:
-                logger.warning("Unable to determine Ollama version")
-        except Exception as e:
-            logger.warning(f"Error checking Ollama version: {e}")
+        result = _probe("ollama", "--version")
+        if result.error is not None:
+            logger.warning(f"Error checking Ollama version: {result.error}")
+        elif result.returncode == 0:
+            logger.info(f"Ollama version: {result.stdout.strip()}")
+        else:
+            logger.warning("Unable to determine Ollama version")
             
     def _check_cuda_availability(self):
         """Check if CUDA is available for GPU inference"""
         try:
             # Check if the CUDA libraries are available
-            result = subprocess.run(["ldconfig", "-p"], capture_output=True, text=True)
+            result = _probe("ldconfig", "-p")
+            if result.error is not None:
+                raise result.error
             cuda_libs = [line for line in result.stdout.split('\n') if 'libcudart.so' in line]
             
             if cuda_libs:
@@ -62,7 +300,9 @@ class OllamaInteractionManager:
                 logger.warning("Consider installing CUDA libraries: sudo apt install nvidia-cuda-toolkit")
                 
             # Check if nvidia-smi command works
-            nvidia_result = subprocess.run(["nvidia-smi"], capture_output=True, text=True)
+            nvidia_result = _probe("nvidia-smi")
+            if nvidia_result.error is not None:
+                raise nvidia_result.error
             if nvidia_result.returncode == 0:
                 logger.info("NVIDIA GPU detected and working")
                 # Extract useful GPU info
@@ -75,6 +315,55 @@ class OllamaInteractionManager:
                 
         except Exception as e:
             logger.warning(f"Error checking CUDA availability: {e}")
+
+    def load_model(self):
+        """Load the model ahead of the first prompt so that request does not also pay for the load"""
+        try:
+            # A generate request without a prompt only loads the model
+            response = self.session.post(self.api_endpoint, data=_json_dumps({"model": self.model, "keep_alive": self.KEEP_ALIVE}),
+                                         headers={"Content-Type": "application/json"}, timeout=(10, self.STREAM_IDLE_TIMEOUT))
+            if response.status_code == 200:
+                logger.info(f"Model '{self.model}' loaded and kept alive for {self.KEEP_ALIVE}")
+                self._model_loaded = True
+            else:
+                logger.warning(f"Unable to preload model '{self.model}': {response.status_code} - {response.text}")
+        except Exception as e:
+            logger.warning(f"Error preloading model '{self.model}': {e}")
+    
+    def unload_model(self):
+        """Ask Ollama to release the memory of the model loaded by load_model"""
+        if not self._model_loaded:
+            return
+        try:
+            self.session.post(self.api_endpoint, data=_json_dumps({"model": self.model, "keep_alive": 0}),
+                              headers={"Content-Type": "application/json"}, timeout=10)
+            logger.info(f"Unloaded model '{self.model}'")
+        except Exception as e:
+            logger.warning(f"Error unloading model '{self.model}': {e}")
+        self._model_loaded = False
+
+    def close(self):
+        """
+        Close the pooled connections to the Ollama API, unloading the model first if unload_on_close is set.
+        Responses still being streamed are dropped and no new request is sent afterwards
+        """
+        with self._streams_lock:
+            self._closed = True
+            open_streams = list(self._open_streams)
+        for response in open_streams:
+            try:
+                # Shutting the socket down also wakes the thread blocked reading it (urllib3 2.3+),
+                # closing it is the best older versions offer
+                shutdown = getattr(response.raw, "shutdown", None)
+                if shutdown is not None:
+                    shutdown()
+                else:
+                    response.close()
+            except Exception as e:
+                logger.debug("Error dropping an open response stream: %s", e)
+        if self.unload_on_close:
+            self.unload_model()
+        self.session.close()
             
     def verify_connection(self):
         """Verify the connection to the Ollama API"""
@@ -82,7 +371,7 @@ class OllamaInteractionManager:
             logger.info(f"Attempting to connect to Ollama API at {self.base_url}")
             
             # Detailed connection attempt with timeout
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=10)
             
             # Log full response for debugging
             logger.info(f"Ollama API response status: {response.status_code}")
@@ -119,38 +408,85 @@ class OllamaInteractionManager:
             return False
     
     def extract_text_from_pdf(self, pdf_path):
-        """Extract text content from a PDF file"""
-        try:
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-                logger.info(f"Extracting text from PDF: {pdf_path} ({num_pages} pages)")
-                
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    text += page_text
-                    
-                    # Log progress for large PDFs
-                    if num_pages > 10 and page_num % 5 == 0:
-                        logger.info(f"Extracted {page_num+1}/{num_pages} pages...")
-            
-            # Log info about extracted content
-            text_length = len(text)
-            logger.info(f"Successfully extracted {text_length} characters from PDF")
-            
-            # Log a sample of the content to verify extraction
-            sample_length = min(200, text_length)
-            logger.info(f"Sample of extracted text: {text[:sample_length]}...")
-            
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting text from PDF '{pdf_path}': {e}")
-            return None
+        """Extract text content from a PDF file, reusing the cached text of identical files"""
+        return extract_pdf_text(pdf_path, self.cache_dir, self.force_refresh)
+    
+    def render_pdf_pages(self, pdf_path, scale=2):
+        """Render every page of a PDF to a base64 encoded PNG for vision-capable models"""
+        return render_pdf_pages(pdf_path, scale)
     
-    def send_prompt(self, prompt, pdf_content=None):
-        """Send a prompt to the Ollama API and get the response"""
+    def send_prompt(self, prompt, pdf_content=None, images=None):
+        """Send a prompt to the Ollama API and get the response, reusing the cached response of identical requests"""
+        if self.cache_dir is None:
+            return self._send_prompt(prompt, pdf_content, images)
+
+        # Everything that shapes the request sent to the model is part of the key
+        key = hashlib.sha256()
+        for part in (self.model, str(self.max_content_length), prompt, pdf_content or "", *(images or ())):
+            key.update(part.encode('utf-8'))
+            key.update(b"\0")
+        cache_name = os.path.join("resp", f"{key.hexdigest()}.json")
+
+        cached = None if self.force_refresh else _read_cache(self.cache_dir, cache_name)
+        if cached is not None:
+            try:
+                response = json.loads(cached)["response"]
+                logger.info("Using cached response from Ollama (length: %d chars)", len(response))
+                return response
+            except Exception as e:
+                logger.warning(f"Ignoring invalid cached response '{cache_name}': {e}")
+
+        response = self._send_prompt(prompt, pdf_content, images)
+        if response:
+            _write_cache(self.cache_dir, cache_name, json.dumps({"model": self.model, "response": response}))
+        return response
+
+    def _stream_response(self, endpoint, payload, chunk_text):
+        """
+        Post payload with streaming enabled and join the text of the chunks as they arrive.
+        Returns the status code and the joined text, or the error body if the status is not 200.
+        Raises if the stream ends before its final chunk, a truncated answer is never returned
+        """
+        if self._closed:
+            raise RuntimeError("The Ollama interaction manager is closed")
+        with self.session.post(endpoint, data=_json_dumps(payload), headers={"Content-Type": "application/json"}, stream=True,
+                               timeout=(10, self.STREAM_IDLE_TIMEOUT)) as response:
+            if response.status_code != 200:
+                return response.status_code, response.text
+            
+            parts = []
+            done = False
+            with self._streams_lock:
+                # A stream opened while the manager was closing would be missed by close
+                if self._closed:
+                    raise RuntimeError("The Ollama interaction manager is closed")
+                self._open_streams.add(response)
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"])
+                    parts.append(chunk_text(chunk))
+                    if chunk.get("done"):
+                        done = True
+                        break
+            except requests.exceptions.ConnectionError as e:
+                # requests reports a stream that stalls past the idle timeout as a connection error,
+                # raise it as the timeout it is so callers do not retry it on another endpoint
+                if isinstance(e.args[0] if e.args else None, ReadTimeoutError):
+                    raise requests.exceptions.ReadTimeout(e.args[0], request=e.request) from e
+                raise
+            finally:
+                with self._streams_lock:
+                    self._open_streams.discard(response)
+            if not done:
+                raise RuntimeError(f"Stream ended before the response was done ({sum(map(len, parts))} chars received)")
+            return response.status_code, "".join(parts)
+
+    def _send_prompt(self, prompt, pdf_content=None, images=None):
+        """Send a prompt, with optional base64 page images, to the Ollama API and get the response"""
         try:
             # Combine PDF content with prompt if provided
             if pdf_content:
@@ -159,7 +495,7 @@ class OllamaInteractionManager:
                     logger.warning(f"PDF content length ({len(pdf_content)} chars) exceeds limit ({self.max_content_length}), truncating")
                     pdf_content = pdf_content[:self.max_content_length] + "... [Content truncated due to length]"
                 else:
-                    logger.info(f"Using full PDF content ({len(pdf_content)} chars)")
+                    logger.debug("Using full PDF content (%d chars)", len(pdf_content))
                 
                 # Simplify prompt structure for better compatibility
                 full_prompt = f"PDF CONTENT:\n{pdf_content}\n\nTASK:\n{prompt}"
@@ -168,59 +504,76 @@ class OllamaInteractionManager:
             
             # Log payload size for debugging
             prompt_size = len(full_prompt)
-            logger.info(f"Sending prompt to Ollama (size: {prompt_size} chars)")
+            logger.info("Sending prompt to Ollama (size: %d chars)", prompt_size)
+            
+            # Page images travel next to the prompt, with the user message for chat and top level for generate
+            image_fields = {"images": images} if images else {}
+            if images:
+                logger.info("Attaching %d page images to the prompt", len(images))
             
             # Set GPU options based on configuration
             gpu_options = {}
             if not self.use_gpu:
                 gpu_options["num_gpu"] = 0  # Force CPU-only mode
-                logger.info("Using CPU-only mode for inference")
+                logger.debug("Using CPU-only mode for inference")
             else:
                 # For GPU mode, we might want to specify all layers on GPU
                 gpu_options["num_gpu"] = 100  # Setting a high number ensures all compatible layers use GPU
-                logger.info("Using GPU acceleration for inference")
+                logger.debug("Using GPU acceleration for inference")
             
-            # First try the chat API which often works better with longer contexts
-            try:
-                chat_endpoint = f"{self.base_url}/api/chat"
-                logger.info(f"Trying Ollama chat API at {chat_endpoint}")
+            # First try the chat API which often works better with longer contexts, unless it already
+            # failed on this server, then every request would wait for it before falling back
+            if self._use_chat_api is not False:
+                try:
+                    chat_endpoint = f"{self.base_url}/api/chat"
+                    logger.debug("Trying Ollama chat API at %s", chat_endpoint)
                 
-                chat_payload = {
-                    "model": self.model,
-                    "messages": [
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,
-                        **gpu_options
+                    chat_payload = {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "user", "content": full_prompt, **image_fields}
+                        ],
+                        "stream": True,
+                        "keep_alive": self.KEEP_ALIVE,
+                        "options": {
+                            "temperature": 0.1,
+                            **gpu_options
+                        }
                     }
-                }
                 
-                # Log that we're sending the request
-                logger.info(f"Sending request to Ollama chat API with {'GPU' if self.use_gpu else 'CPU'} mode")
-                logger.info(f"Request timeout set to 600 seconds (10 minutes)")
+                    # Log that we're sending the request
+                    logger.debug("Sending request to Ollama chat API with %s mode", "GPU" if self.use_gpu else "CPU")
+                    logger.debug("Request idle timeout set to %d seconds", self.STREAM_IDLE_TIMEOUT)
                 
-                # Increased timeout for very large documents
-                response = requests.post(chat_endpoint, json=chat_payload, timeout=600)
+                    # The response is streamed, the timeout applies between chunks instead of to the whole answer
+                    status_code, response_text = self._stream_response(
+                        chat_endpoint, chat_payload, lambda chunk: chunk.get("message", {}).get("content", ""))
                 
-                if response.status_code == 200:
-                    logger.info("Successfully received response from chat API")
-                    chat_response = response.json()
-                    return chat_response.get("message", {}).get("content", "")
-                else:
-                    logger.warning(f"Chat API failed with status {response.status_code}, falling back to generate API")
-            except Exception as e:
-                logger.warning(f"Error using chat API, falling back to generate API: {e}")
+                    if status_code == 200:
+                        logger.info("Successfully received response from chat API")
+                        self._use_chat_api = True
+                        return response_text
+                    else:
+                        logger.warning(f"Chat API failed with status {status_code}, falling back to generate API")
+                        if status_code == 404 and self._use_chat_api is None:
+                            # This server has no chat API, use only the generate API from now on
+                            self._use_chat_api = False
+                except requests.exceptions.Timeout:
+                    # The generate API would time out on the same model, do not wait twice
+                    raise
+                except Exception as e:
+                    logger.warning(f"Error using chat API, falling back to generate API: {e}")
             
             # Fall back to the standard generate API
-            logger.info(f"Sending request to Ollama generate API at {self.api_endpoint}")
+            logger.debug("Sending request to Ollama generate API at %s", self.api_endpoint)
             
             # Use more compatible API parameters
             payload = {
                 "model": self.model,
                 "prompt": full_prompt,
-                "stream": False,
+                **image_fields,
+                "stream": True,
+                "keep_alive": self.KEEP_ALIVE,
                 "options": {
                     "temperature": 0.1,
                     "num_predict": 1024,  # Increased for more comprehensive responses
@@ -228,19 +581,18 @@ class OllamaInteractionManager:
                 }
             }
             
-            response = requests.post(self.api_endpoint, json=payload, timeout=600)  # 10 minute timeout
+            status_code, response_text = self._stream_response(
+                self.api_endpoint, payload, lambda chunk: chunk.get("response", ""))
             
-            if response.status_code == 200:
-                response_data = response.json()
-                response_text = response_data.get("response", "")
-                logger.info(f"Received response from Ollama (length: {len(response_text)} chars)")
+            if status_code == 200:
+                logger.info("Received response from Ollama (length: %d chars)", len(response_text))
                 return response_text
             else:
-                logger.error(f"Error from Ollama API: {response.status_code} - {response.text}")
+                logger.error(f"Error from Ollama API: {status_code} - {response_text}")
                 
                 # Provide specific troubleshooting advice based on error
-                if "exit status 127" in response.text:
-                    if "libcudart" in response.text:
+                if "exit status 127" in response_text:
+                    if "libcudart" in response_text:
                         logger.error("CUDA libraries are missing. Try installing with: sudo apt install nvidia-cuda-toolkit")
                         logger.error("Or switch to CPU-only mode by setting use_gpu=False")
                     else:
@@ -262,9 +614,14 @@ class OllamaInteractionManager:
 
 
 class PDFToExcelProcessor:
+    
+    # Number of papers whose Excel rows are buffered before the workbook is saved
+    EXCEL_FLUSH_INTERVAL = 10
+    
     def __init__(self, pdf_folder_path, review_config, qa_sheet_name, de_sheet_name, max_questions, 
                  ollama_url="http://localhost:11434", ollama_model="gemma2:latest", use_handler=True,
-                 use_gpu=True, max_content_length=None):
+                 use_gpu=True, max_content_length=None, max_concurrent_requests=1, force_refresh=False,
+                 multimodal=False, unload_model_on_exit=False):
         
         self.pdf_folder_path = pdf_folder_path
         
@@ -272,18 +629,27 @@ class PDFToExcelProcessor:
         self.excel_file_path = os.path.join(pdf_folder_path, "sheet")
         self.rejected_file_path = os.path.join(pdf_folder_path, "rejected")
         self.folder_pths = [self.analysed_folder_path, self.excel_file_path, self.rejected_file_path]
+        # Debug files are kept across runs, so this folder is not removed with the ones above
+        self.debug_folder_path = os.path.join(pdf_folder_path, "debug_logs")
 
         self.qa_sheet_name = qa_sheet_name
         self.de_sheet_name = de_sheet_name
         self.use_gpu = use_gpu
         self.use_handler = use_handler
+        # Ollama requests kept in flight while earlier responses are processed,
+        # the server must allow as many parallel requests (OLLAMA_NUM_PARALLEL)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
         
-        # Initialize Ollama manager with GPU support and no content truncation
+        # Initialize Ollama manager with GPU support, no content truncation and a cache in the PDF folder
         self.ollama_manager = OllamaInteractionManager(
             base_url=ollama_url, 
             model=ollama_model, 
             use_gpu=use_gpu,
-            max_content_length=max_content_length
+            max_content_length=max_content_length,
+            cache_dir=os.path.join(pdf_folder_path, ".cache"),
+            force_refresh=force_refresh,
+            multimodal=multimodal,
+            unload_on_close=unload_model_on_exit
         )
         
         self.response_handler = ResponseHandler()
@@ -297,12 +663,16 @@ class PDFToExcelProcessor:
         self.data_extraction_fields = self.review_parser.get_all_data_extraction_fields()
         self.cutoff_score = self.review_parser.get_cutoff_score()
         self.excluding_questions = self.review_parser.get_all_excluding_questions()
+        # Score keys of the excluding questions, built once instead of per paper
+        self._excluding_score_keys = [(e_question, f"{e_question} Score") for e_question in self.excluding_questions]
 
     def initiate_ollama_manager(self):
         """Initialize connection to Ollama"""
         try:
             if self.ollama_manager.verify_connection():
                 logger.info("Successfully connected to Ollama")
+                # Load the model now so the first paper does not also wait for it
+                self.ollama_manager.load_model()
                 return True
             else:
                 logger.error("Failed to connect to Ollama")
@@ -314,25 +684,44 @@ class PDFToExcelProcessor:
     def get_pdf_paths(self):
         if not os.path.exists(self.pdf_folder_path):
             raise FileNotFoundError(f"The folder '{self.pdf_folder_path}' does not exist.")
-        return [os.path.join(self.pdf_folder_path, f) for f in os.listdir(self.pdf_folder_path) if f.lower().endswith(".pdf")]
+        # scandir entries carry their full path and file type, no extra joins or stat calls
+        with os.scandir(self.pdf_folder_path) as entries:
+            return [entry.path for entry in entries if entry.name.lower().endswith(".pdf") and entry.is_file()]
 
-    def send_pdf_to_analysis(self, pdf_path, prompt):
-        """Send PDF content and analysis prompt to Ollama"""
+    def send_pdf_to_analysis(self, pdf_path, prompt, content_future=None):
+        """
+        Send PDF content and analysis prompt to Ollama, content_future may hold the text
+        or the page images already being prepared in a worker process
+        """
         try:
-            # Extract text from PDF
-            pdf_content = self.ollama_manager.extract_text_from_pdf(pdf_path)
-            if not pdf_content:
-                logger.error(f"Could not extract text from PDF: {pdf_path}")
-                return None
+            images = None
+            if self.ollama_manager.multimodal:
+                # Vision models get the rendered pages, the text is not extracted at all
+                if content_future is not None:
+                    images = content_future.result()
+                else:
+                    images = self.ollama_manager.render_pdf_pages(pdf_path)
+                if not images:
+                    logger.error(f"Could not render pages of PDF: {pdf_path}")
+                    return None
+                pdf_content = f"[{len(images)} page images attached]"
+            else:
+                # Extract text from PDF
+                if content_future is not None:
+                    pdf_content = content_future.result()
+                else:
+                    pdf_content = self.ollama_manager.extract_text_from_pdf(pdf_path)
+                if not pdf_content:
+                    logger.error(f"Could not extract text from PDF: {pdf_path}")
+                    return None
             
             # Log information about the content and prompt being sent
             pdf_content_length = len(pdf_content)
             prompt_length = len(prompt)
-            logger.info(f"Preparing to send PDF content ({pdf_content_length} chars) and prompt ({prompt_length} chars) to Ollama")
+            logger.info("Preparing to send PDF content (%d chars) and prompt (%d chars) to Ollama", pdf_content_length, prompt_length)
             
-            # Create a debug file with the exact content being sent
-            debug_dir = os.path.join(os.path.dirname(pdf_path), "debug_logs")
-            os.makedirs(debug_dir, exist_ok=True)
+            # Create a debug file with the exact content being sent, run creates the debug folder
+            debug_dir = self.debug_folder_path
             
             pdf_filename = os.path.basename(pdf_path)
             debug_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_debug.txt")
@@ -344,26 +733,30 @@ class PDFToExcelProcessor:
                 f.write("===== PROMPT =====\n\n")
                 f.write(prompt)
             
-            logger.info(f"Saved debug content to {debug_filename}")
+            logger.debug("Saved debug content to %s", debug_filename)
                 
             # Send prompt and PDF content to Ollama
-            response = self.ollama_manager.send_prompt(prompt, pdf_content)
+            if images:
+                response = self.ollama_manager.send_prompt(prompt, images=images)
+            else:
+                response = self.ollama_manager.send_prompt(prompt, pdf_content)
             
             # Log information about the response
             if response:
                 response_length = len(response)
-                logger.info(f"Received response from Ollama: {response_length} characters")
+                logger.info("Received response from Ollama: %d characters", response_length)
                 
-                # Log the full response text
-                logger.info("===== LLM RESPONSE BEGIN =====")
-                logger.info(response[:1000] + "..." if len(response) > 1000 else response)  # Truncate in logs only
-                logger.info("===== LLM RESPONSE END =====")
+                # Log the response text, truncated and only built when debug output is shown
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("===== LLM RESPONSE BEGIN =====")
+                    logger.debug("%s%s", response[:1000], "..." if len(response) > 1000 else "")
+                    logger.debug("===== LLM RESPONSE END =====")
                 
                 # Save the response to a debug file
                 response_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_response.txt")
                 with open(response_filename, 'w', encoding='utf-8') as f:
                     f.write(response)
-                logger.info(f"Saved response to {response_filename}")
+                logger.debug("Saved response to %s", response_filename)
             else:
                 logger.error("No response received from Ollama")
                 
@@ -372,24 +765,53 @@ class PDFToExcelProcessor:
             logger.error(f"Error sending PDF for analysis: {e}")
             return None
 
-    def move_analysed_file(self, file_path):
-        if not os.path.exists(self.analysed_folder_path):
-            os.makedirs(self.analysed_folder_path, exist_ok=True)
+    def _move_file(self, file_path, folder):
+        # The folders are created by create_folders, and inside the PDF folder a rename is enough,
+        # shutil.move is only needed when the folder is on another file system
         try:
-            shutil.move(file_path, self.analysed_folder_path)
-            logger.info(f"Moved '{file_path}' to '{self.analysed_folder_path}'.")
+            # os.replace overwrites silently, so a PDF with the same name already in the folder
+            # is kept and this one gets a numbered name instead
+            name, ext = os.path.splitext(os.path.basename(file_path))
+            destination = os.path.join(folder, name + ext)
+            copy_number = 1
+            while os.path.lexists(destination):
+                destination = os.path.join(folder, f"{name} ({copy_number}){ext}")
+                copy_number += 1
+            
+            try:
+                os.replace(file_path, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(file_path, destination)
+            logger.info(f"Moved '{file_path}' to '{destination}'.")
         except Exception as e:
             logger.error(f"Error moving file '{file_path}': {e}")
+
+    def move_analysed_file(self, file_path):
+        self._move_file(file_path, self.analysed_folder_path)
             
     def move_rejected_file(self, file_path):
-        if not os.path.exists(self.rejected_file_path):
-            os.makedirs(self.rejected_file_path, exist_ok=True)
-        try:
-            shutil.move(file_path, self.rejected_file_path)
-            logger.info(f"Moved '{file_path}' to '{self.rejected_file_path}'.")
-        except Exception as e:
-            logger.error(f"Error moving file '{file_path}': {e}")
+        self._move_file(file_path, self.rejected_file_path)
             
+    def _flush_rows(self, pending_moves):
+        """Save the buffered Excel rows, then move the PDFs those rows belong to"""
+        if self.excel_parser.flush():
+            for move, pdf_path in pending_moves:
+                move(pdf_path)
+        elif pending_moves:
+            logger.error(f"Could not save the rows of {len(pending_moves)} papers, leaving their PDFs in the input folder")
+        pending_moves.clear()
+
+    @contextlib.contextmanager
+    def _moves_after_flush(self):
+        """Collect the PDFs to move during a run, the last ones are moved after the final save"""
+        pending_moves = []
+        try:
+            yield pending_moves
+        finally:
+            self._flush_rows(pending_moves)
+
     def create_folders(self):
         for folder in self.folder_pths:
             try:
@@ -403,22 +825,21 @@ class PDFToExcelProcessor:
     def delete_folders(self):
         for folder in self.folder_pths:
             try:
-                # Check if folder exists, and if true, remove it
-                if os.path.exists(folder) and os.path.isdir(folder):
-                    shutil.rmtree(folder)
+                # Remove the folder, one that does not exist is already deleted
+                shutil.rmtree(folder)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Unable to delete folder: {folder}.")
 
     def run(self):
-        # Create folder for analysis
+        # Create folder for analysis, and the debug folder once instead of for every paper
         self.create_folders()
+        os.makedirs(self.debug_folder_path, exist_ok=True)
         
         # Initialize the Excel sheets
         self.excel_parser.create_excel_file()
-        qa_identifiers = []
-        for qa in self.qa_fields:
-            qa_identifiers.append(f"{qa["id"]}")
-            qa_identifiers.append(f"{qa["id"]}_SCORE")
+        qa_identifiers = list(chain.from_iterable((qa["id"], f"{qa["id"]}_SCORE") for qa in self.qa_fields))
 
         self.excel_parser.apply_excel_template(self.qa_sheet_name, ["TITLE"] + qa_identifiers + ["TOTAL_SCORE"])
         de_identifiers = [de["key"] for de in self.data_extraction_fields]
@@ -455,153 +876,204 @@ class PDFToExcelProcessor:
         
         logger.info(f"Created LLM response Log file at: {response_log_file}")
         
-        for pdf_path in self.get_pdf_paths():
-            if pdf_path.lower().endswith(".pdf"):
-                if num_question == self.max_questions:
-                    if self.use_handler:
-                        handler.new_chat()
-                    else:
-                        self.ollama_manager.new_conversation()
-                    num_question = 0
+        # Get the analysis prompt
+        prompt = self.review_parser.get_analysis_prompt()
+        pdf_paths = self.get_pdf_paths()
+        
+        # Ollama requests do not depend on each other, so they run in the background while the
+        # responses are processed in order below. Only a window of papers is submitted ahead, an
+        # interrupted run then does not leave every remaining request queued
+        executor = None
+        extract_pool = None
+        pending_responses = {}
+        upcoming_paths = iter(pdf_paths)
+        request_window = 2 * self.max_concurrent_requests
+        try:
+            if not self.use_handler:
+                # Text extraction and page rendering are CPU-bound, worker processes prepare the PDFs of
+                # the window while the model is busy with the current one. PDFium is not thread-safe,
+                # in processes it also never runs from two request threads at once
+                if pdf_paths:
+                    extract_pool = ProcessPoolExecutor(max_workers=min(max(1, (os.cpu_count() or 1) // 2), len(pdf_paths)))
                 
-                try:
-                    logger.info(f"Processing file: {pdf_path}")
+                executor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests)
+            
+            # Rows are buffered and the workbook is saved once per batch instead of twice per paper,
+            # the response log stays open for the whole run instead of being reopened per paper.
+            # Processed PDFs are only moved once their rows are saved
+            with self.excel_parser.batch(), open(response_log_file, 'a', encoding='utf-8', buffering=1 << 16) as log_file, \
+                    self._moves_after_flush() as pending_moves:
+                for index, pdf_path in enumerate(pdf_paths):
+                    # Top up the window of submitted requests, then take this paper's one out of it
+                    response_future = None
+                    if executor:
+                        for next_path in islice(upcoming_paths, request_window - len(pending_responses)):
+                            # The extraction is submitted first, so the worker processes are started
+                            # before any request thread exists. Only the request holds the content future,
+                            # the text or page images are released once its request is done
+                            content_future = None
+                            if extract_pool:
+                                if self.ollama_manager.multimodal:
+                                    content_future = extract_pool.submit(render_pdf_pages, next_path)
+                                else:
+                                    content_future = extract_pool.submit(extract_pdf_text, next_path, self.ollama_manager.cache_dir,
+                                                                         self.ollama_manager.force_refresh)
+                            pending_responses[next_path] = executor.submit(self.send_pdf_to_analysis, next_path, prompt, content_future)
+                        response_future = pending_responses.pop(pdf_path)
                     
-                    # Get the analysis prompt
-                    prompt = self.review_parser.get_analysis_prompt()
+                    # Save the buffered rows every few papers, a crash then loses at most those
+                    # and their PDFs are still in the input folder for the next run
+                    if index and index % self.EXCEL_FLUSH_INTERVAL == 0:
+                        self._flush_rows(pending_moves)
+                
+                    if num_question == self.max_questions:
+                        if self.use_handler:
+                            handler.new_chat()
+                        else:
+                            self.ollama_manager.new_conversation()
+                        num_question = 0
+                
+                    try:
+                        logger.info(f"Processing file: {pdf_path}")
                     
-                    # Log prompt for debugging
-                    debug_dir = os.path.join(os.path.dirname(pdf_path), "debug_logs")
-                    os.makedirs(debug_dir, exist_ok=True)
+                        # Log prompt for debugging
+                        debug_dir = self.debug_folder_path
                     
-                    pdf_filename = os.path.basename(pdf_path)
-                    prompt_debug_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_prompt.txt")
+                        pdf_filename = os.path.basename(pdf_path)
+                        prompt_debug_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_prompt.txt")
                     
-                    with open(prompt_debug_filename, 'w', encoding='utf-8') as f:
-                        f.write(prompt)
+                        with open(prompt_debug_filename, 'w', encoding='utf-8') as f:
+                            f.write(prompt)
                     
-                    logger.info(f"Saved prompt to {prompt_debug_filename}")
+                        logger.info(f"Saved prompt to {prompt_debug_filename}")
                     
-                    # Send PDF and prompt for analysis
-                    response = None
-                    if self.use_handler:
-                        try:
-                            # First upload the PDF
-                            logger.info(f"Uploading PDF file to ChatGPT: {pdf_path}")
-                            if not handler.input_external_file(pdf_path):
-                                logger.error(f"Failed to upload PDF file: {pdf_path}")
-                                continue
+                        # Send PDF and prompt for analysis
+                        response = None
+                        if self.use_handler:
+                            try:
+                                # First upload the PDF
+                                logger.info(f"Uploading PDF file to ChatGPT: {pdf_path}")
+                                if not handler.input_external_file(pdf_path):
+                                    logger.error(f"Failed to upload PDF file: {pdf_path}")
+                                    continue
                                 
-                            # Wait for the file to be processed
-                            time.sleep(5)
+                                # Wait for the file to be processed
+                                time.sleep(5)
                             
-                            # Now send the prompt as a separate message
-                            logger.info(f"Sending analysis prompt (length: {len(prompt)})")
-                            response = handler.send_and_receive(prompt)
+                                # Now send the prompt as a separate message
+                                logger.info(f"Sending analysis prompt (length: {len(prompt)})")
+                                response = handler.send_and_receive(prompt)
                             
-                            if not response:
-                                logger.error("No response received from ChatGPT")
-                                continue
+                                if not response:
+                                    logger.error("No response received from ChatGPT")
+                                    continue
                                 
-                        except Exception as e:
-                            logger.error(f"Error processing with ChatGPT: {e}")
-                            continue
-                    else:
-                        response = self.send_pdf_to_analysis(pdf_path, prompt)
+                            except Exception as e:
+                                logger.error(f"Error processing with ChatGPT: {e}")
+                                continue
+                        else:
+                            response = response_future.result()
 
-                    num_question += 1
+                        num_question += 1
                     
-                    # Write the response to the consolidated log file
-                    with open(response_log_file, 'a', encoding='utf-8') as log_file:
+                        # Write the response to the consolidated log file, flushed so the log is complete
+                        # on disk after every paper
                         log_file.write(f"\n\n{'='*80}\n")
                         log_file.write(f"PDF: {os.path.basename(pdf_path)}\n")
                         log_file.write(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                         log_file.write(f"{'='*80}\n\n")
-                        
+                    
                         if response:
                             log_file.write(response)
                         else:
                             log_file.write("*** NO RESPONSE RECEIVED ***")
+                        log_file.flush()
                     
-                    # Save the full response to a separate file for debugging
-                    if response:
-                        response_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_response.txt")
-                        with open(response_filename, 'w', encoding='utf-8') as f:
-                            f.write(response)
-                        logger.info(f"Saved full response to {response_filename}")
+                        # Save the full response to a separate file for debugging, send_pdf_to_analysis
+                        # already saved the Ollama responses there
+                        if response and self.use_handler:
+                            response_filename = os.path.join(debug_dir, f"{os.path.splitext(pdf_filename)[0]}_response.txt")
+                            with open(response_filename, 'w', encoding='utf-8') as f:
+                                f.write(response)
+                            logger.info(f"Saved full response to {response_filename}")
                     
-                    if not response:
-                        logger.warning(f"No response for file: {pdf_path}")
-                        continue
+                        if not response:
+                            logger.warning(f"No response for file: {pdf_path}")
+                            continue
                     
-                    # IMPORTANT: First extract the DE data to get the title
-                    de_data = self.review_parser.get_data_extraction_text(response)
+                        # IMPORTANT: Extract the QA and DE data together, the DE data gives the title
+                        qa_data, de_data = self.review_parser.parse_response(response)
                     
-                    # Try to get the title - first check for different key variations
-                    paper_title = None
-                    for title_key in ["TITLE", "Title", "title"]:
-                        if title_key in de_data:
+                        # Try to get the title - first check for different key variations
+                        title_key = next((key for key in _TITLE_KEYS if key in de_data), None)
+                        paper_title = None
+                        if title_key is not None:
                             paper_title = de_data[title_key]
                             logger.info(f"Found title: {paper_title}")
-                            break
                     
-                    # If no title found, use the PDF filename as a fallback
-                    if not paper_title:
-                        paper_title = os.path.splitext(os.path.basename(pdf_path))[0]
-                        logger.warning(f"No title found in data extraction, using filename: {paper_title}")
+                        # If no title found, use the PDF filename as a fallback
+                        if not paper_title:
+                            paper_title = os.path.splitext(os.path.basename(pdf_path))[0]
+                            logger.warning(f"No title found in data extraction, using filename: {paper_title}")
                     
-                    # Extract QA data and calculate average score
-                    qa_data = self.review_parser.get_quality_assessment_text(response)
-                    paper_score = qa_data.pop("Total Score", 0)  # Extract average score for logging
+                        # Take the average score out of the QA data
+                        paper_score = qa_data.pop("Total Score", 0)  # Extract average score for logging
                     
-                    # Add title to QA data
-                    qa_data["Title"] = paper_title
+                        # Add title to QA data
+                        qa_data["Title"] = paper_title
                     
-                    if qa_data:
-                        # Add the QA data with title and score to the Excel sheet
-                        self.excel_parser.fill_excel_with_data(self.qa_sheet_name, {**qa_data, "Total Score": paper_score})
-                        logger.info(f"Total QA Score: {paper_score}")
-                    else:
-                        logger.warning(f"No QA data found for file: {pdf_path}")
+                        if qa_data:
+                            # Add the QA data with title and score to the Excel sheet, the score goes back
+                            # into qa_data itself instead of a copy (the dict is only read from here on)
+                            qa_data["Total Score"] = paper_score
+                            self.excel_parser.fill_excel_with_data(self.qa_sheet_name, qa_data)
+                            logger.info(f"Total QA Score: {paper_score}")
+                        else:
+                            logger.warning(f"No QA data found for file: {pdf_path}")
                         
-                    # Check if any of the excluding questions have a score equal to "0"
-                    check_e_question = 0
-                    for e_question in self.excluding_questions:
-                        if qa_data.get(f"{e_question} Score", 1) == 0:  # Default to 1 if key not found
-                            logger.info(f"Paper does not match the score needed for excluding question: {e_question}")
-                            self.move_rejected_file(pdf_path)
-                            check_e_question += 1
+                        # Check if any of the excluding questions have a score equal to "0"
+                        # (default to 1 if key not found), the first one is enough to reject the paper
+                        excluded_by = next((e_question for e_question, score_key in self._excluding_score_keys
+                                            if qa_data.get(score_key, 1) == 0), None)
                     
-                    if check_e_question != 0:
-                        continue
+                        if excluded_by is not None:
+                            logger.info(f"Paper does not match the score needed for excluding question: {excluded_by}")
+                            pending_moves.append((self.move_rejected_file, pdf_path))
+                            continue
                             
-                    # Extract and write DE data only if the score meets the cutoff
-                    if paper_score and paper_score >= self.cutoff_score:
-                        logger.info(f"Paper score ({paper_score}) meets the cutoff ({self.cutoff_score}). Extracting DE data...")
-                        if de_data:
-                            # Make sure the title in DE data matches what we used in QA data
-                            if "TITLE" in de_data and paper_title:
-                                de_data["TITLE"] = paper_title
+                        # Extract and write DE data only if the score meets the cutoff
+                        if paper_score and paper_score >= self.cutoff_score:
+                            logger.info(f"Paper score ({paper_score}) meets the cutoff ({self.cutoff_score}). Extracting DE data...")
+                            if de_data:
+                                # Make sure the title in DE data matches what we used in QA data
+                                if "TITLE" in de_data and paper_title:
+                                    de_data["TITLE"] = paper_title
                                 
-                            self.excel_parser.fill_excel_with_data(self.de_sheet_name, de_data)
+                                self.excel_parser.fill_excel_with_data(self.de_sheet_name, de_data)
+                            else:
+                                logger.warning(f"No DE data found for file: {pdf_path}")
                         else:
-                            logger.warning(f"No DE data found for file: {pdf_path}")
-                    else:
-                        logger.info(f"Paper score ({paper_score}) does not meet the cutoff ({self.cutoff_score}). Skipping DE data extraction.")
-                        self.move_rejected_file(pdf_path)
-                        continue
+                            logger.info(f"Paper score ({paper_score}) does not meet the cutoff ({self.cutoff_score}). Skipping DE data extraction.")
+                            pending_moves.append((self.move_rejected_file, pdf_path))
+                            continue
 
-                    # Move the processed file to analysed folder
-                    self.move_analysed_file(pdf_path)
-                    
-                    # Add a small delay between processing files
-                    time.sleep(random.randint(1, 3))
+                        # Move the processed file to analysed folder
+                        pending_moves.append((self.move_analysed_file, pdf_path))
                     
-                except Exception as e:
-                    logger.error(f"Error processing file '{pdf_path}': {e}")
+                        # Pace the ChatGPT web interface between files, the Ollama API needs no delay
+                        if self.use_handler:
+                            time.sleep(random.randint(1, 3))
                     
-            else:
-                logger.info(f"Skipping non-PDF file: {pdf_path}")
+                    except Exception as e:
+                        logger.error(f"Error processing file '{pdf_path}': {e}")
+        finally:
+            # Queued requests are cancelled and the running ones are not waited for, closing the
+            # manager drops their streams instead of letting the model finish each of them
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if extract_pool:
+                extract_pool.shutdown(cancel_futures=True)
+            self.ollama_manager.close()
         
         # Close the browser when done
         if self.use_handler and handler:
@@ -0,0 +1,41 @@
+import sys
+import time
+from pathlib import Path
+
+from reviewbygpt.lib.review_data_parser import ReviewDataParser
+
+import logging
+# Keep the parser's per-field logging out of the timings
+logging.getLogger("reviewbygpt").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Paths are resolved from this file so the script runs from any checkout
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "review_data.yaml"
+
+def make_responses(n, qa_ids, de_keys):
+    """
+    Yield n synthetic responses in the marked format asked for by the analysis prompt,
+    one QE item per QA id and one field per DE key
+    """
+    for i in range(n):
+        qa_lines = "\n".join(f"{qe_id}: Synthetic assessment {i} of {qe_id}.\n{qe_id}_SCORE: {(i + j) % 3 / 2}"
+                             for j, qe_id in enumerate(qa_ids))
+        de_lines = "\n".join(f"{key}: Synthetic value {i}" for key in de_keys)
+        yield (f"==QUALITY_ASSESSMENT_START==\n{qa_lines}\n==QUALITY_ASSESSMENT_END==\n"
+               f"==DATA_EXTRACTION_START==\n{de_lines}\n==DATA_EXTRACTION_END==\n")
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    review_parser = ReviewDataParser(config=str(CONFIG_PATH))
+    qa_ids = [qa["id"] for qa in review_parser.get_all_quality_assessment_fields()]
+    de_keys = [de["key"] for de in review_parser.get_all_data_extraction_fields()]
+
+    responses = list(make_responses(n, qa_ids, de_keys))
+
+    start = time.perf_counter()
+    for response in responses:
+        review_parser.parse_response(response)
+    elapsed = time.perf_counter() - start
+
+    logger.info("Parsed %d responses in %.3f s (%.1f us per response)", n, elapsed, elapsed / n * 1e6)
@@ -1,7 +1,11 @@
 import os
 from pathlib import Path
 import shutil
-import time
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 def create_folders():
         
@@ -10,28 +14,29 @@ def create_folders():
         try:
             # Check if folder exists, and if not, create
             Path(folder).mkdir(parents=True, exist_ok=True)
-            print(f"Created folder: {folder}.")
+            logger.info("Created folder: %s.", folder)
         
         except Exception as e:
-            print(f"Unable to create folder: {folder}.")
+            logger.error("Unable to create folder: %s. %s", folder, e)
             
 def delete_folders():
         
     for folder in folder_pths:
     
         try:
-            # Check if folder exists, and if true, remove it
-            if os.path.exists(folder) and os.path.isdir(folder):
-                shutil.rmtree(folder)
-                
-            print(f"Deleted folder: {folder}.")
+            # Remove the folder, one that does not exist is already deleted
+            shutil.rmtree(folder)
+            logger.info("Deleted folder: %s.", folder)
+        
+        except FileNotFoundError:
+            logger.info("Folder not found: %s.", folder)
         
         except Exception as e:
-            print(f"Unable to create folder: {folder}.")
+            logger.error("Unable to delete folder: %s. %s", folder, e)
 
 if __name__ == "__main__":
     
-    pdf_folder_path = "/home/pedrodias/Documents/git-repos/ReviewbyGPT/tests/test_dir"
+    pdf_folder_path = str(Path(__file__).resolve().parent / "test_dir")
     
     analysed_folder_path = os.path.join(pdf_folder_path, "analysed")
     excel_file_path = os.path.join(pdf_folder_path, "sheet")
@@ -39,5 +44,6 @@ if __name__ == "__main__":
     folder_pths = [analysed_folder_path, excel_file_path, rejected_file_path]
     
     create_folders()
-    time.sleep(5)
+    # mkdir is synchronous, the folders exist as soon as it returns
+    assert all(Path(folder).is_dir() for folder in folder_pths)
     delete_folders()
\ No newline at end of file
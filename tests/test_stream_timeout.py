@@ -0,0 +1,51 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reviewbygpt.scripts.pdf_to_excel import OllamaInteractionManager
+
+import logging
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds the stub server stalls in the middle of a stream, longer than the idle timeout below
+STALL_SECONDS = 3
+
+class StalledStreamHandler(BaseHTTPRequestHandler):
+    """Ollama stub that sends the first chunk of a streamed answer and then stops sending"""
+    hits = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.hits.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        self.wfile.write(json.dumps({"message": {"content": "partial"}, "response": "partial", "done": False}).encode() + b"\n")
+        self.wfile.flush()
+        time.sleep(STALL_SECONDS)
+
+    def log_message(self, format, *args):
+        pass
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StalledStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    manager = OllamaInteractionManager(base_url=f"http://127.0.0.1:{server.server_port}", model="stub", use_gpu=False)
+    manager.STREAM_IDLE_TIMEOUT = 1
+
+    start = time.perf_counter()
+    response = manager.send_prompt("prompt", "content")
+    elapsed = time.perf_counter() - start
+    logger.info("Stalled stream gave %r after %.1f s, endpoints hit: %s", response, elapsed, StalledStreamHandler.hits)
+
+    # The idle timeout ends the request, it must not be retried on the generate API
+    assert response is None
+    assert StalledStreamHandler.hits == ["/api/chat"], StalledStreamHandler.hits
+    assert elapsed < 2 * manager.STREAM_IDLE_TIMEOUT, elapsed
+
+    manager.close()
+    server.shutdown()